@@ -4,40 +4,77 @@ Each concrete Game class wraps a normalized event dict (from api layer) and
 exposes convenience properties + formatted lines for display screens.
 """
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Dict, Any, List, Type, TypeVar, Optional
+import sys
+from typing import Dict, Any, List, Tuple, Type, TypeVar, Optional
+
+
+def _intern(value: Any) -> Any:
+    """sys.intern strings that repeat across every game (abbrs, ids, states)."""
+    return sys.intern(value) if isinstance(value, str) else value
 
 
-@dataclass
 class TeamSide:
-    id: Optional[str]
-    abbr: str
-    score: str
-    record: Optional[str]
-    logo: Optional[str] = None  # URL if available
+    """One competitor in a game (slotted; built once per refresh per side)."""
+
+    __slots__ = ("id", "abbr", "score", "record", "logo", "probables", "probable_pitcher")
+
+    def __init__(
+        self,
+        id: Optional[str],
+        abbr: str,
+        score: str,
+        record: Optional[str],
+        logo: Optional[str] = None,  # URL if available
+        probables: Optional[List[Any]] = None,
+        probable_pitcher: Optional[str] = None,
+    ):
+        self.id = id
+        self.abbr = abbr
+        self.score = score
+        self.record = record
+        self.logo = logo
+        self.probables = probables
+        self.probable_pitcher = probable_pitcher
+
+    def __repr__(self) -> str:
+        return f"TeamSide(id={self.id!r}, abbr={self.abbr!r}, score={self.score!r}, record={self.record!r})"
 
     @staticmethod
     def from_dict(d: Dict[str, Any]) -> "TeamSide":
         return TeamSide(
-            id=d.get("id"),
-            abbr=d.get("abbreviation") or "???",
+            id=_intern(d.get("id")),
+            abbr=_intern(d.get("abbreviation") or "???"),
             score=str(d.get("score", "0")),
             record=d.get("record"),
             logo=d.get("logo"),
+            probables=d.get("probables") or None,
+            probable_pitcher=d.get("probable_pitcher") or None,
         )
 
 
 T = TypeVar("T", bound="BaseGame")
 
+# Pre-bound template: "AWY 3 - 5 HOM"
+_SCORE_FMT = "{} {} - {} {}".format
+
 
 class BaseGame:
     sport: str = "generic"
 
+    # Subclasses declare ``__slots__ = ()`` so game objects never grow a __dict__.
+    __slots__ = (
+        "raw", "id", "state", "status", "clock", "period", "start_time",
+        "home", "away", "leaders", "last_play",
+        # Memoized presentation output; raw is fixed for the object's lifetime
+        # (factory builds a fresh game per api refresh) so no invalidation needed.
+        "_score_line", "_status_line", "_leaders_lines", "_as_dict",
+    )
+
     def __init__(self, raw: Dict[str, Any]):
         self.raw = raw
         self.id: str = raw.get("id")
-        self.state: str = raw.get("state")
-        self.status: str = raw.get("status")
+        self.state: str = _intern(raw.get("state"))
+        self.status: str = _intern(raw.get("status"))
         self.clock: str = raw.get("clock", "")
         self.period = raw.get("period")
         self.start_time: str = raw.get("start_time")
@@ -45,6 +82,10 @@ class BaseGame:
         self.away = TeamSide.from_dict(raw.get("away_team", {}))
         self.leaders: Dict[str, Any] = raw.get("leaders", {})
         self.last_play: Optional[str] = raw.get("last_play")
+        self._score_line: Optional[str] = None
+        self._status_line: Optional[str] = None
+        self._leaders_lines: Optional[Tuple[str, ...]] = None
+        self._as_dict: Optional[Dict[str, Any]] = None
 
     # ---------- Factories ----------
     @classmethod
@@ -53,9 +94,28 @@ class BaseGame:
 
     # ---------- Presentation helpers ----------
     def score_line(self) -> str:
-        return f"{self.away.abbr} {self.away.score} - {self.home.score} {self.home.abbr}"
+        if self._score_line is None:
+            away, home = self.away, self.home
+            self._score_line = _SCORE_FMT(away.abbr, away.score, home.score, home.abbr)
+        return self._score_line
 
     def status_line(self) -> str:
+        if self._status_line is None:
+            self._status_line = self._build_status_line()
+        return self._status_line
+
+    def leaders_lines(self) -> Tuple[str, ...]:
+        if self._leaders_lines is None:
+            self._leaders_lines = self._build_leaders_lines()
+        return self._leaders_lines
+
+    def detail_lines(self) -> Tuple[str, ...]:
+        if self.last_play and self.state == "in":
+            return (self.score_line(), self.status_line(), self.last_play[:48])
+        return (self.score_line(), self.status_line())
+
+    # ---------- Internal helpers ----------
+    def _build_status_line(self) -> str:
         if self.state == "pre":
             return self.status or "Scheduled"
         if self.state == "post":
@@ -64,8 +124,8 @@ class BaseGame:
         period_txt = self._period_text()
         return f"{period_txt} {self.clock}".strip()
 
-    def leaders_lines(self) -> List[str]:
-        # Base version: compress generic leaders dict
+    def _build_leaders_lines(self) -> Tuple[str, ...]:
+        # Base version: compress generic leaders dict; subclasses override this
         lines: List[str] = []
         for key, info in self.leaders.items():
             if isinstance(info, dict):
@@ -73,28 +133,23 @@ class BaseGame:
             elif isinstance(info, list):  # list of dicts (prem scoring leaders)
                 for item in info[:3]:
                     lines.append(f"{key[:3].upper()} {item.get('athlete','')} {item.get('display','')}")
-        return lines[:3]
+        return tuple(lines[:3])
 
-    def detail_lines(self) -> List[str]:
-        lines = [self.score_line(), self.status_line()]
-        if self.last_play and self.state == "in":
-            lines.append(self.last_play[:48])
-        return lines
-
-    # ---------- Internal helpers ----------
     def _period_text(self) -> str:
         return f"P{self.period}" if self.period is not None else ""
 
     # ---------- Generic mapping for screen usage ----------
     def as_dict(self) -> Dict[str, Any]:
-        return {
-            "id": self.id,
-            "sport": self.sport,
-            "score_line": self.score_line(),
-            "status_line": self.status_line(),
-            "leaders": self.leaders_lines(),
-            "detail_lines": self.detail_lines(),
-        }
+        if self._as_dict is None:
+            self._as_dict = {
+                "id": self.id,
+                "sport": self.sport,
+                "score_line": self.score_line(),
+                "status_line": self.status_line(),
+                "leaders": self.leaders_lines(),
+                "detail_lines": self.detail_lines(),
+            }
+        return self._as_dict
 
 
 __all__ = ["BaseGame", "TeamSide"]
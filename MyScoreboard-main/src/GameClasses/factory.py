@@ -1,19 +1,20 @@
 """Factory utilities to build Game objects from normalized api event dicts."""
 from __future__ import annotations
-from typing import Dict, Any, Type
+from typing import Callable, Dict, Any
 from .base import BaseGame
 from .nflGame import NFLGame
 from .mlbGame import MLBGame
 from .premGame import PremGame
 
-SPORT_CLASS_MAP = {
+# Constructors called directly (cls(event)); skips the from_event classmethod hop.
+SPORT_CTOR: Dict[str, Callable[[Dict[str, Any]], BaseGame]] = {
     "nfl": NFLGame,
     "mlb": MLBGame,
     "prem": PremGame,
 }
+SPORT_CLASS_MAP = SPORT_CTOR  # backwards-compatible name
 
 def game_from_event(event: Dict[str, Any]) -> BaseGame:
-    cls: Type[BaseGame] = SPORT_CLASS_MAP.get(event.get("sport"), BaseGame)  # type: ignore
-    return cls.from_event(event)
+    return SPORT_CTOR.get(event.get("sport"), BaseGame)(event)
 
-__all__ = ["game_from_event", "SPORT_CLASS_MAP"]
+__all__ = ["game_from_event", "SPORT_CTOR", "SPORT_CLASS_MAP"]
@@ -1,80 +1,219 @@
 from __future__ import annotations
-from typing import List, Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from .base import BaseGame
 
+_NAME_KEYS = ("fullName", "displayName", "shortName")
+# Fallback inning labels indexed by period ("In 1" .. "In 20"); index 0 is blank.
+_INNING = ("",) + tuple(f"In {i}" for i in range(1, 21))
+_HALF_LABEL = {"top": "TOP", "bot": "BOT"}
+_P_FMT = "P {} {}".format
+_B_FMT = "B {} {}".format
+
+
+def _probable_name(probables: Any) -> Optional[str]:
+	"""First athlete name found in an ESPN probables list, else None."""
+	if not isinstance(probables, list):
+		return None
+	for item in probables:
+		ath = item.get("athlete") if isinstance(item, dict) else None
+		if isinstance(ath, dict):
+			name = next((ath[k] for k in _NAME_KEYS if ath.get(k)), None)
+			if name:
+				return name
+	return None
+
+
+def _pitcher_last_name(obj, role: str, raw) -> str:
+	"""Extract probable pitcher's last name from various possible structures.
+	Supports attributes or dict keys: probable_pitcher, starting_pitcher, pitcher, probablePitcher, probables(list).
+	Adds heuristic scan of any attribute/key containing 'pitch'; falls back to the
+	game's raw competitors (role is 'away'/'home') when the side has nothing."""
+	# 1. Direct attributes/dict entries
+	candidates = []
+	for attr in ("probable_pitcher", "starting_pitcher", "pitcher", "probablePitcher"):
+		val = getattr(obj, attr, None)
+		if not val and isinstance(obj, dict):
+			val = obj.get(attr)
+		if val:
+			candidates.append(val)
+	# 1b. Heuristic scan for ANY attribute/key containing 'pitch'
+	try:
+		for attr_name in dir(obj):
+			if 'pitch' in attr_name.lower():
+				val = getattr(obj, attr_name, None)
+				if val and val not in candidates:
+					candidates.append(val)
+	except Exception:
+		pass
+	if isinstance(obj, dict):
+		for k,v in obj.items():
+			if isinstance(k,str) and 'pitch' in k.lower():
+				if v and v not in candidates:
+					candidates.append(v)
+	# 2. Probables list (ESPn style): obj.probables -> list of dicts with athlete.fullName / displayName
+	prob_list = getattr(obj, 'probables', None)
+	if not prob_list and isinstance(obj, dict):
+		prob_list = obj.get('probables')
+	if isinstance(prob_list, (list, tuple)) and prob_list:
+		for item in prob_list:
+			if not isinstance(item, dict):
+				continue
+			ath = item.get('athlete') or {}
+			if isinstance(ath, dict):
+				full = ath.get('fullName') or ath.get('displayName') or ath.get('shortName')
+				if full:
+					candidates.append(full)
+			else:
+				# maybe item itself has displayName
+				dsp = item.get('displayName') or item.get('fullName')
+				if dsp:
+					candidates.append(dsp)
+	# 2b. Fallback: search raw competitors structure if still empty
+	if not candidates:
+		raw = raw or {}
+		comps = []
+		# ESPN style sometimes under competitions[0].competitors
+		if isinstance(raw, dict):
+			if 'competitors' in raw:
+				comps = raw.get('competitors') or []
+			elif 'competitions' in raw:
+				try:
+					comps = (raw['competitions'][0] or {}).get('competitors', [])
+				except Exception:
+					comps = []
+		if isinstance(comps, list):
+			for c in comps:
+				if not isinstance(c, dict):
+					continue
+				if c.get('homeAway') != role:
+					continue
+				# look in competitor probables
+				plist = c.get('probables') or []
+				for item in plist:
+					if not isinstance(item, dict):
+						continue
+					ath = item.get('athlete') or {}
+					if isinstance(ath, dict):
+						full = ath.get('fullName') or ath.get('displayName') or ath.get('shortName')
+						if full:
+							candidates.append(full)
+					else:
+						# direct item names
+						full = item.get('displayName') or item.get('fullName')
+						if full:
+							candidates.append(full)
+	# 3. Reduce candidates to last name
+	for name in candidates:
+		if not name:
+			continue
+		# Nested dict candidate
+		if isinstance(name, dict):
+			for k in ("last_name","lname","name_last","last"):
+				if k in name and name[k]:
+					ln = str(name[k]).split()[-1]
+					return ln[:8].upper()
+			for k in ("display","full","name"):
+				if k in name and name[k]:
+					ln = str(name[k]).split()[-1]
+					return ln[:8].upper()
+		elif isinstance(name, str):
+			parts = name.strip().split()
+			if parts:
+				return parts[-1][:8].upper()
+	return ""
+
 
 class MLBGame(BaseGame):
 	sport = "mlb"
+	# Situation fields are read several times per frame; resolve them once here.
+	__slots__ = ("batter", "pitcher", "outs_text", "half", "bases", "_inning_info", "_pitcher_names")
 
 	def __init__(self, raw: Dict[str, Any]):
 		super().__init__(raw)
-		# Attach MLB-specific probable pitcher info to team sides (without polluting base TeamSide dataclass)
-		for role, side in (("home", self.home), ("away", self.away)):
-			team_raw = raw.get(f"{role}_team", {}) or {}
-			probables = team_raw.get("probables") if isinstance(team_raw, dict) else None
-			probable_name = team_raw.get("probable_pitcher") if isinstance(team_raw, dict) else None
-			# Derive probable_name from probables list if absent
-			if not probable_name and isinstance(probables, list) and probables:
-				for item in probables:
-					if not isinstance(item, dict):
-						continue
-					ath = item.get("athlete") or {}
-					if isinstance(ath, dict):
-						probable_name = ath.get("fullName") or ath.get("displayName") or ath.get("shortName")
-					if probable_name:
-						break
-			# Set dynamic attributes for screen heuristics
-			if probables:
-				setattr(side, "probables", probables)
-			if probable_name:
-				setattr(side, "probable_pitcher", probable_name)
+		self.batter: str = (raw.get("batter") or "")[:14]
+		self.pitcher: str = (raw.get("pitcher") or "")[:14]
+		self.outs_text: str = raw.get("outs_text") or ""
+		self.half: str = (raw.get("half") or "").lower()
+		self.bases: Tuple[bool, bool, bool] = (
+			bool(raw.get("on_first")),
+			bool(raw.get("on_second")),
+			bool(raw.get("on_third")),
+		)
+		self._inning_info: Optional[Tuple[str, str]] = None
+		self._pitcher_names: Optional[Tuple[str, str]] = None
+		# Probable pitcher fields are slotted on TeamSide (filled by from_dict); derive the
+		# name from the probables list when the api layer did not supply one.
+		for side in (self.home, self.away):
+			if not side.probable_pitcher:
+				side.probable_pitcher = _probable_name(side.probables)
 
 	def _period_text(self) -> str:  # inning
 		# Prefer explicit display_inning from raw if present
 		disp = self.raw.get("display_inning")
 		if disp:
 			return disp
-		if self.period:
-			return f"In {self.period}"  # fallback
-		return ""
+		p = self.period
+		if isinstance(p, int) and 0 <= p < len(_INNING):
+			return _INNING[p]
+		return f"In {p}" if p else ""  # fallback
 
-	@property
-	def venue(self) -> str:
-		return (self.raw.get("venue") or "").strip()
+	def inning_info(self) -> Tuple[str, str]:
+		"""(half_side, label) for the in-progress screen, e.g. ('top', 'TOP 5').
 
-	@property
-	def outs_text(self) -> str:
-		return self.raw.get("outs_text") or ""
+		half_side is 'top', 'bot' or ''. Parsed once per game from display_inning
+		('T5' / 'B5' from our processor, or 'In 5'), falling back to half/period.
+		"""
+		if self._inning_info is None:
+			display_inning = (self.raw.get("display_inning") or "").strip()
+			half_side = ""
+			inning_num = ""
+			if display_inning.startswith("T") and display_inning[1:].isdigit():
+				half_side = "top"
+				inning_num = display_inning[1:]
+			elif display_inning.startswith("B") and display_inning[1:].isdigit():
+				half_side = "bot"
+				inning_num = display_inning[1:]
+			else:
+				if self.half.startswith("top"):
+					half_side = "top"
+				elif self.half.startswith("bot"):
+					half_side = "bot"
+				if self.period:
+					inning_num = str(self.period)
+			# Final safety: parse any digits out if still blank
+			if not inning_num:
+				inning_num = "".join(ch for ch in display_inning if ch.isdigit())
+			self._inning_info = (half_side, f"{_HALF_LABEL.get(half_side, '')} {inning_num}".strip())
+		return self._inning_info
 
-	@property
-	def batter(self) -> str:
-		return (self.raw.get("batter") or "")[:14]
+	def pitcher_names(self) -> Tuple[str, str]:
+		"""(away, home) probable pitcher last names for the pre-game screen, '?' when unknown.
 
-	@property
-	def pitcher(self) -> str:
-		return (self.raw.get("pitcher") or "")[:14]
+		Resolved once per game; the factory builds a fresh game on every api refresh.
+		"""
+		if self._pitcher_names is None:
+			raw = self.raw
+			self._pitcher_names = (
+				_pitcher_last_name(self.away, "away", raw) or "?",
+				_pitcher_last_name(self.home, "home", raw) or "?",
+			)
+		return self._pitcher_names
 
 	@property
-	def half(self) -> str:
-		return (self.raw.get("half") or "").lower()
-
-	@property
-	def bases(self):
-		return (
-			bool(self.raw.get("on_first")),
-			bool(self.raw.get("on_second")),
-			bool(self.raw.get("on_third")),
-		)
+	def venue(self) -> str:
+		return (self.raw.get("venue") or "").strip()
 
-	def leaders_lines(self) -> List[str]:
-		lines: List[str] = []
+	def _build_leaders_lines(self) -> Tuple[str, ...]:
 		pitching = self.leaders.get("pitching")
 		batting = self.leaders.get("batting")
+		lines = ()
 		if pitching:
-			lines.append(f"P {pitching.get('athlete','')} {pitching.get('display','')}")
+			g = pitching.get
+			lines += (_P_FMT(g('athlete', ''), g('display', '')),)
 		if batting:
-			lines.append(f"B {batting.get('athlete','')} {batting.get('display','')}")
-		return lines[:3]
+			g = batting.get
+			lines += (_B_FMT(g('athlete', ''), g('display', '')),)
+		return lines
 
 
 __all__ = ["MLBGame"]
@@ -1,28 +1,39 @@
 from __future__ import annotations
-from typing import List
+from typing import Tuple
 from .base import BaseGame
 
+# Quarter labels indexed by period; later periods fall back to formatting.
+_PERIOD = ("", "Q1", "Q2", "Q3", "Q4")
+_QB_FMT = "QB {} {}".format
+_RB_FMT = "RB {} {}".format
+_WR_FMT = "WR {} {}".format
+
 
 class NFLGame(BaseGame):
 	sport = "nfl"
+	__slots__ = ()
 
 	def _period_text(self) -> str:
-		if self.period:
-			return f"Q{self.period}"
-		return ""
+		p = self.period
+		if isinstance(p, int) and 0 <= p < len(_PERIOD):
+			return _PERIOD[p]
+		return f"Q{p}" if p else ""
 
-	def leaders_lines(self) -> List[str]:
-		lines: List[str] = []
+	def _build_leaders_lines(self) -> Tuple[str, ...]:
 		passing = self.leaders.get("passing")
 		rushing = self.leaders.get("rushing")
 		receiving = self.leaders.get("receiving")
+		lines = ()
 		if passing:
-			lines.append(f"QB {passing.get('athlete','')} {passing.get('display','')}")
+			g = passing.get
+			lines += (_QB_FMT(g('athlete', ''), g('display', '')),)
 		if rushing:
-			lines.append(f"RB {rushing.get('athlete','')} {rushing.get('display','')}")
+			g = rushing.get
+			lines += (_RB_FMT(g('athlete', ''), g('display', '')),)
 		if receiving:
-			lines.append(f"WR {receiving.get('athlete','')} {receiving.get('display','')}")
-		return lines[:3]
+			g = receiving.get
+			lines += (_WR_FMT(g('athlete', ''), g('display', '')),)
+		return lines
 
 
 __all__ = ["NFLGame"]
@@ -1,29 +1,32 @@
 from __future__ import annotations
-from typing import List
+from typing import List, Tuple
 from .base import BaseGame
 
+# Half labels indexed by period; extra periods fall back to formatting.
+_PERIOD = ("", "1H", "2H")
+_G_FMT = "G {} {}".format
+
 
 class PremGame(BaseGame):
 	sport = "prem"
+	__slots__ = ()
 
 	def _period_text(self) -> str:
-		if self.period == 1:
-			return "1H"
-		if self.period == 2:
-			return "2H"
-		if self.period:
-			return f"P{self.period}"
-		return ""
+		p = self.period
+		if isinstance(p, int) and 0 <= p < len(_PERIOD):
+			return _PERIOD[p]
+		return f"P{p}" if p else ""
 
-	def leaders_lines(self) -> List[str]:
+	def _build_leaders_lines(self) -> Tuple[str, ...]:
 		# Use scoring leaders if present
 		lines: List[str] = []
 		# Different keys may exist; flatten all lists
 		for key, val in self.leaders.items():
 			if isinstance(val, list):
 				for item in val[:3]:
-					lines.append(f"G {item.get('athlete','')} {item.get('display','')}")
-		return lines[:3]
+					g = item.get
+					lines.append(_G_FMT(g('athlete', ''), g('display', '')))
+		return tuple(lines[:3])
 
 
 __all__ = ["PremGame"]
@@ -7,7 +7,7 @@ from __future__ import annotations
 import time
 from typing import Iterable, List
 from ..GameClasses.mlbGame import MLBGame
-from .common import prepare_lines, draw_frame
+from .common import prepare_lines, draw_frame, frame_canvas, swap_canvas
 
 
 def batting_line(game: MLBGame) -> List[str]:
@@ -21,10 +21,10 @@ def batting_line(game: MLBGame) -> List[str]:
 
 
 def render_batting(matrix, game: MLBGame, hold: float = 3.0):
-	canvas = matrix.CreateFrameCanvas()
+	canvas = frame_canvas(matrix)
 	lines = prepare_lines(batting_line(game), max_lines=4, max_chars=15)
 	draw_frame(canvas, lines)
-	canvas = matrix.SwapOnVSync(canvas)
+	swap_canvas(matrix, canvas)
 	time.sleep(hold)
 
 
@@ -5,7 +5,10 @@ Provides graceful fallback when rgbmatrix lib not present (prints frames).
 """
 from __future__ import annotations
 import os
-from typing import List, Iterable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Iterable, Tuple
 
 try:  # real library
     from rgbmatrix import graphics  # type: ignore
@@ -24,6 +27,17 @@ except Exception:  # fallback stubs
             if hasattr(canvas, 'lines'):
                 canvas.lines.append((x, y, text))
             return x + len(text) * 4
+try:
+    from zoneinfo import ZoneInfo  # Python 3.9+
+except Exception:  # pragma: no cover
+    ZoneInfo = None  # type: ignore
+try:
+    from PIL import Image  # type: ignore
+except Exception:  # Pillow missing; logos are unavailable anyway
+    Image = None  # type: ignore
+
+# Shared immutable color; safe to build at import for both real lib and stub.
+WHITE = graphics.Color(255, 255, 255)
 
 PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
 # Candidate font paths (repo clone + system misc fonts)
@@ -39,46 +53,41 @@ _BOLD_FONT_PATHS = [
 ]
 DEFAULT_FONT_PATH = next((p for p in _CANDIDATE_FONT_PATHS if os.path.isfile(p)), _CANDIDATE_FONT_PATHS[0])
 
-class FontManager:
-    _font = None
-    _bold_font = None
+# Loaded fonts keyed by (bold,); filled on first request per style.
+_FONT_CACHE: Dict[Tuple[bool], object] = {}
+
+def _load_first(paths: Iterable[str]):
+    """Return a Font loaded from the first path that works, else None."""
+    f = graphics.Font()
+    for p in paths:
+        try:
+            f.LoadFont(p)
+            return f
+        except Exception:
+            continue
+    return None
 
+class FontManager:
     @classmethod
     def get_font(cls, bold=False):
+        key = (bold,)
+        font = _FONT_CACHE.get(key)
+        if font is None:
+            font = _FONT_CACHE[key] = cls._load_font(bold)
+        return font
+
+    @classmethod
+    def _load_font(cls, bold: bool):
         if bold:
-            if cls._bold_font is None:
-                f = graphics.Font()
-                loaded = False
-                for p in _BOLD_FONT_PATHS:
-                    try:
-                        f.LoadFont(p)
-                        loaded = True
-                        break
-                    except Exception:
-                        continue
-                if not loaded:
-                    # Fallback to regular font if bold not found
-                    return cls.get_font(bold=False)
-                cls._bold_font = f
-            return cls._bold_font
-        else:
-            if cls._font is None:
-                f = graphics.Font()
-                loaded = False
-                for p in _CANDIDATE_FONT_PATHS:
-                    try:
-                        f.LoadFont(p)
-                        loaded = True
-                        break
-                    except Exception:
-                        continue
-                if not loaded:
-                    # Font not critical; drawing still works in stub context.
-                    pass
-                cls._font = f
-            return cls._font
+            f = _load_first(_BOLD_FONT_PATHS)
+            # Fallback to regular font if bold not found
+            return f if f is not None else cls.get_font(bold=False)
+        f = _load_first(_CANDIDATE_FONT_PATHS)
+        # Font not critical; drawing still works in stub context.
+        return f if f is not None else graphics.Font()
 
-def wrap_text(text: str, max_chars: int) -> List[str]:
+@lru_cache(maxsize=2048)
+def _wrap_text_cached(text: str, max_chars: int) -> Tuple[str, ...]:
     words = text.split()
     lines: List[str] = []
     cur = []
@@ -97,7 +106,10 @@ def wrap_text(text: str, max_chars: int) -> List[str]:
                 cur_len += 1 + len(w)
     if cur:
         lines.append(" ".join(cur))
-    return lines or [""]
+    return tuple(lines) or ("",)
+
+def wrap_text(text: str, max_chars: int) -> List[str]:
+    return list(_wrap_text_cached(text, max_chars))
 
 def truncate(text: str, max_chars: int) -> str:
     return text if len(text) <= max_chars else text[: max_chars - 1] + '…'
@@ -114,26 +126,189 @@ def center_x_width(text: str, glyph_w: int, panel_width: int = 64) -> int:
     text_w = len(text) * glyph_w
     return max(0, (panel_width - text_w) // 2)
 
-def prepare_lines(raw_lines: Iterable[str], max_lines: int = 5, max_chars: int = 15) -> List[str]:
+@lru_cache(maxsize=512)
+def _prepare_lines_cached(raw_lines: Tuple[str, ...], max_lines: int, max_chars: int) -> Tuple[str, ...]:
     out: List[str] = []
     for line in raw_lines:
         if not line:
             continue
-        for wrapped in wrap_text(line, max_chars):
+        if len(line) <= max_chars and ' '.join(line.split()) == line:
+            # Fast path: most scores/statuses already fit with single spaces, which
+            # wrapping would return as-is; skip the word loop and truncate.
+            if len(out) >= max_lines:
+                return tuple(out)
+            out.append(line)
+            continue
+        for wrapped in _wrap_text_cached(line, max_chars):
             if len(out) >= max_lines:
-                return out
+                return tuple(out)
             out.append(truncate(wrapped, max_chars))
+    return tuple(out)
+
+# Off-screen buffer handed back by the last SwapOnVSync: id(matrix) -> (matrix, canvas).
+# Holding the matrix keeps its id from being reused by another object.
+_BACK_BUFFER: Dict[int, Tuple[object, object]] = {}
+
+def frame_canvas(matrix):
+    """Return a cleared off-screen canvas, reusing the buffer the last swap handed back.
+
+    rgbmatrix allocates (and never frees) a new buffer on every CreateFrameCanvas().
+    The entry is left in place (swap_canvas replaces it), so a render that raises
+    before swapping does not make the next frame allocate again.
+    """
+    entry = _BACK_BUFFER.get(id(matrix))
+    if entry is None:
+        return matrix.CreateFrameCanvas()
+    canvas = entry[1]
+    canvas.Clear()
+    return canvas
+
+def swap_canvas(matrix, canvas):
+    """SwapOnVSync and keep the returned back buffer for the next frame_canvas() call."""
+    back = matrix.SwapOnVSync(canvas)
+    if back is not None:
+        _BACK_BUFFER[id(matrix)] = (matrix, back)
+    return back
+
+@lru_cache(maxsize=None)
+def zone_info(name: str):
+    """Shared ZoneInfo for name; instances are immutable, so each is built (and its tzdata read) once."""
+    return ZoneInfo(name)
+
+def panel_size(obj) -> Tuple[int, int]:
+    """Return (width, height) of a matrix or canvas, assuming a 64x32 panel when unknown.
+
+    The panel never changes size, so callers probe once and pass the ints down.
+    """
+    return getattr(obj, 'width', 64), getattr(obj, 'height', 32)
+
+def prepare_lines(raw_lines: Iterable[str], max_lines: int = 5, max_chars: int = 15) -> List[str]:
+    # Results are cached by content; the same score/status lines are re-wrapped every frame.
+    return list(_prepare_lines_cached(tuple(raw_lines), max_lines, max_chars))
+
+# Gamma 2.2 table applied to logos on request (built once at import).
+GAMMA_LUT: Tuple[int, ...] = tuple(int(((i / 255.0) ** 2.2) * 255 + 0.5) for i in range(256))
+
+_ALPHA_MIN = 90  # skip mostly transparent feather pixels
+_ALPHA_MASK_LUT = [0] * _ALPHA_MIN + [255] * (256 - _ALPHA_MIN)
+
+def flatten_logo(img, lut=None):
+    """Return an RGB copy of a logo with feather pixels (alpha < 90) blacked out.
+
+    Black is "off" on the panel, so the result can be pushed with a single
+    canvas.SetImage() call instead of one SetPixel per pixel. ``lut`` is an
+    optional 256-entry gamma table applied to every channel.
+    """
+    if img.mode != 'RGBA':
+        # remove_bg logos are RGBA already; normalize the rare P/LA/RGB input so
+        # there is a single masked path (and palette transparency is honored)
+        img = img.convert('RGBA')
+    rgb = img.convert('RGB')
+    if lut is not None:
+        rgb = rgb.point(list(lut) * 3)
+    mask = img.getchannel('A').point(_ALPHA_MASK_LUT)
+    out = Image.new('RGB', img.size)
+    out.paste(rgb, (0, 0), mask)
     return out
 
+# SetImage-ready logos keyed by (sport, abbr, size, gamma_correct); logos never change per frame.
+# Keyed like logo_cache's own processed cache (team, not URL): a new feed URL would
+# return the same cached image from get_processed_logo anyway.
+_TEAM_LOGOS: Dict[Tuple[str, str, int, bool], object] = {}
+
+def team_logo(sport: str, team, size: int, gamma_correct: bool = False):
+    """Return the flattened logo for a team side, resolving and processing it only once."""
+    key = (sport, team.abbr, size, gamma_correct)
+    flat = _TEAM_LOGOS.get(key)
+    if flat is None:
+        from ..logo_cache import get_processed_logo  # pulls in requests; only needed on a miss
+        img = get_processed_logo(sport, team.abbr, url=getattr(team, 'logo', None), size=size, remove_bg=True)
+        if img is None:
+            return None  # not cached so a later refresh can retry the fetch
+        flat = _TEAM_LOGOS[key] = flatten_logo(img, GAMMA_LUT if gamma_correct else None)
+    return flat
+
+def prefetched(games, preload=None):
+    """Yield games in order, each once ``preload((game,))`` has finished for it.
+
+    The preloads run on one background worker in display order, so the next
+    game's logos are fetched while the current one is on screen. With no
+    preload the games are yielded as-is. Closing the generator (the caller's
+    loop ending early or raising) cancels the fetches that were never needed.
+    """
+    games = list(games)
+    if preload is None:
+        yield from games
+        return
+    pool = ThreadPoolExecutor(max_workers=1)
+    pending = [pool.submit(preload, (g,)) for g in games]
+    try:
+        for g, fut in zip(games, pending):
+            fut.result()
+            yield g
+    finally:
+        for fut in pending:
+            fut.cancel()
+        pool.shutdown(wait=False)
+
+def blit_logo(canvas, flat, ox: int, oy: int, width: int, height: int):
+    """Draw a flattened logo at (ox, oy), clipped to the width x height panel area."""
+    if flat is None:
+        return
+    w, h = flat.size
+    x0, y0 = max(0, -ox), max(0, -oy)
+    x1, y1 = min(w, width - ox), min(h, height - oy)
+    if x0 >= x1 or y0 >= y1:
+        return
+    if (x0, y0, x1, y1) != (0, 0, w, h):
+        flat = flat.crop((x0, y0, x1, y1))
+    try:
+        canvas.SetImage(flat, ox + x0, oy + y0)
+    except Exception:
+        pass
+
+def blit_corner_logos(canvas, left, right, width: int, height: int, oy: int = 0):
+    """Draw flattened logos in the top-left and top-right corners (either may be None)."""
+    if left is not None:
+        blit_logo(canvas, left, 0, oy, width, height)
+    if right is not None:
+        blit_logo(canvas, right, width - right.size[0], oy, width, height)
+
+def pace_frame(deadline: float, step: float) -> float:
+    """Sleep until ``deadline + step`` (time.monotonic() based) and return it as the next deadline.
+
+    Time spent drawing the frame counts toward the step instead of being added to
+    it. After an overrun of more than a full step the schedule restarts from now
+    rather than bursting frames to catch up.
+    """
+    deadline += step
+    remaining = deadline - time.monotonic()
+    if remaining > 0:
+        time.sleep(remaining)
+    elif remaining < -step:
+        deadline = time.monotonic()
+    return deadline
+
 def draw_frame(canvas, lines: List[str], *, start_y: int = 6, line_height: int = 8, center: bool = True, color=None):
     font = FontManager.get_font()
-    color = color or graphics.Color(255, 255, 255)
+    color = color or WHITE
     y = start_y
     for line in lines:
         x = center_x(line) if center else 0
         graphics.DrawText(canvas, font, x, y, color, line)
         y += line_height
 
+def draw_scroll_text(canvas, font, x: int, y: int, color, text: str, char_w: int, width: int):
+    """Draw ``text`` one glyph per char_w starting at x, skipping glyphs fully off the panel.
+
+    Only the visible index range is walked, so long scroll strings cost
+    O(width / char_w) DrawText calls per frame instead of O(len(text)).
+    """
+    first = max(0, -((x + char_w) // char_w))  # first idx with x + idx*char_w >= -char_w
+    last = min(len(text), -((x - width) // char_w))  # first idx with x + idx*char_w >= width
+    for idx in range(first, last):
+        graphics.DrawText(canvas, font, x + idx * char_w, y, color, text[idx])
+
 def draw_text_small_bold(canvas, font, x: int, y: int, color, text: str, *, style: str = "h1"):
     """Simulate a bold effect for tiny (4x6) font by overdrawing with a 1px offset.
 
@@ -150,5 +325,7 @@ def draw_text_small_bold(canvas, font, x: int, y: int, color, text: str, *, styl
     return end_x
 
 __all__ = [
-    'wrap_text', 'truncate', 'center_x', 'center_x_width', 'prepare_lines', 'draw_frame', 'draw_text_small_bold', 'FontManager'
+    'wrap_text', 'truncate', 'center_x', 'center_x_width', 'prepare_lines', 'draw_frame', 'draw_text_small_bold', 'FontManager',
+    'WHITE', 'panel_size', 'frame_canvas', 'swap_canvas', 'flatten_logo', 'blit_logo', 'blit_corner_logos',
+    'pace_frame', 'draw_scroll_text', 'zone_info', 'team_logo', 'prefetched',
 ]
@@ -1,15 +1,13 @@
 """MLB screen rendering for 64x32 panel."""
 from __future__ import annotations
+import re
 import time
-from typing import Iterable, List
+from contextlib import closing
+from functools import lru_cache, partial
+from typing import Dict, Iterable, List, Tuple
 from datetime import datetime
-try:
-	from zoneinfo import ZoneInfo  # Python 3.9+
-except Exception:  # pragma: no cover
-	ZoneInfo = None  # type: ignore
 from ..GameClasses.mlbGame import MLBGame
-from ..logo_cache import get_logo, get_logo_from_url, get_processed_logo
-from .common import prepare_lines, draw_frame
+from .common import graphics, Image, ZoneInfo, blit_logo, blit_corner_logos, prepare_lines, FontManager, WHITE, panel_size, center_x, center_x_width, draw_text_small_bold, frame_canvas, swap_canvas, pace_frame, draw_scroll_text, zone_info, team_logo, prefetched
 
 
 def game_primary_lines(game: MLBGame) -> List[str]:
@@ -19,14 +17,15 @@ def game_primary_lines(game: MLBGame) -> List[str]:
 	return base
 
 
-def game_leaders_lines(game: MLBGame) -> List[str]:
+def game_leaders_lines(game: MLBGame) -> Tuple[str, ...]:
 	return game.leaders_lines()
 
 
 
+@lru_cache(maxsize=128)
 def _format_local_start_time(start_iso: str | None, target_tz: str = 'America/New_York') -> str:
 	"""Convert an ISO 8601 UTC (or naive) time to HH:MM in target tz (default Eastern).
-	Assumes UTC when naive. Returns '' on failure."""
+	Assumes UTC when naive. Returns '' on failure. Memoized; start times repeat every cycle."""
 	if not start_iso or 'T' not in start_iso:
 		return ''
 	iso = start_iso.strip()
@@ -35,9 +34,9 @@ def _format_local_start_time(start_iso: str | None, target_tz: str = 'America/Ne
 	try:
 		dt = datetime.fromisoformat(iso)
 		if dt.tzinfo is None and ZoneInfo:
-			dt = dt.replace(tzinfo=ZoneInfo('UTC'))
+			dt = dt.replace(tzinfo=zone_info('UTC'))
 		if ZoneInfo:
-			local = dt.astimezone(ZoneInfo(target_tz))
+			local = dt.astimezone(zone_info(target_tz))
 			return f"{local.hour:02d}:{local.minute:02d}"
 		return iso.split('T',1)[1][:5]
 	except Exception:
@@ -46,602 +45,348 @@ def _format_local_start_time(start_iso: str | None, target_tz: str = 'America/Ne
 		except Exception:
 			return ''
 
-def render_game(matrix, game: MLBGame, leaders: bool = False, hold: float = 2.5, show_logos: bool = True, big_layout: bool = True, gamma_correct: bool = False):
-	canvas = matrix.CreateFrameCanvas()
-	# Detect actual canvas size (fallback to assumed 64x32)
-	width = getattr(canvas, 'width', getattr(canvas, 'GetWidth', lambda: 64)()) if hasattr(canvas, 'width') else 64
-	height = getattr(canvas, 'height', getattr(canvas, 'GetHeight', lambda: 32)()) if hasattr(canvas, 'height') else 32
-
-	# Shared gamma correction helper (used for logos AND text)
-	if gamma_correct:
-		if not hasattr(render_game, "_gamma_lut"):
-			g = 2.2
-			render_game._gamma_lut = [int(((i / 255.0) ** g) * 255 + 0.5) for i in range(256)]
-		LUT = render_game._gamma_lut  # type: ignore[attr-defined]
-		def _gc(v: int) -> int: return LUT[v]
-	else:
-		def _gc(v: int) -> int: return v
 
-	def gcolor(r: int, g: int, b: int):
-		from ..Screens.common import graphics  # local import to avoid circular top-level
-		return graphics.Color(_gc(r), _gc(g), _gc(b))
+_FONT = None
+_BOLD_FONT = None
 
-	# Helper to dynamically fit pitcher name inside available pixel width using 4px tiny font glyphs.
-	def _fit_name(name: str, max_px: int) -> str:
-		if not name or max_px <= 0:
-			return ''
-		name = name.upper()
-		char_w = 4
-		if len(name) * char_w <= max_px:
-			return name
-		# Try last segment (after space or hyphen)
-		import re
-		segments = re.split(r"[\s-]+", name)
-		if segments:
-			last_seg = segments[-1]
-			if len(last_seg) * char_w <= max_px:
-				return last_seg
-		# Remove vowels from end (except first letter)
-		core = list(last_seg)
-		vowels = set("AEIOU")
-		# Keep first letter always
-		for i in range(len(core)-1, 0, -1):
-			if len(core) * char_w <= max_px:
-				break
-			if core[i] in vowels:
-				core.pop(i)
+# Bases diamond palette (raw RGB, not gamma corrected)
+_BASE_OCC = (255, 0, 0)  # occupied base
+_BASE_EMP = (60, 60, 60)
+_OUT_ON = (255, 0, 0)
+_OUT_OFF = (70, 70, 70)
+_HOME_PLATE = (180, 180, 180)
+_DIAMOND_OUTLINE = (40, 40, 40)
+_DIAMOND_OFFSETS = ((-1, -1), (0, -2), (1, -1), (2, 0), (1, 1), (0, 2), (-1, 1), (-2, 0))
+
+
+def _draw_diamond(setp, cx: int, cy: int, b1, b2, b3, outs: int):
+	"""Draw outs dots + bases diamond centered at (cx, cy) through setp(x, y, color)."""
+	for i in range(3):
+		setp(cx - 2 + i*2, cy - 4, _OUT_ON if i < outs else _OUT_OFF)
+	# Occupied base color changed to red per request
+	occ = _BASE_OCC
+	emp = _BASE_EMP
+	setp(cx, cy-2, occ if b2 else emp)      # Second
+	setp(cx+2, cy, occ if b1 else emp)      # First
+	setp(cx-2, cy, occ if b3 else emp)      # Third
+	setp(cx, cy+2, _HOME_PLATE)             # Home
+	for (dx,dy) in _DIAMOND_OFFSETS:
+		setp(cx+dx, cy+dy, _DIAMOND_OUTLINE)
+
+
+# 5x7 RGB patches keyed by (first, second, third, outs); only 32 combinations exist.
+_DIAMOND_CACHE: Dict[Tuple[bool, bool, bool, int], object] = {}
+
+
+def _diamond_image(b1, b2, b3, outs: int):
+	"""Return the diamond as a SetImage-ready patch whose top-left is (cx - 2, cy - 4)."""
+	key = (bool(b1), bool(b2), bool(b3), max(0, min(outs, 3)))
+	img = _DIAMOND_CACHE.get(key)
+	if img is None:
+		img = Image.new('RGB', (5, 7))
+		put = img.putpixel
+		_draw_diamond(lambda x, y, color: put((x, y), color), 2, 4, *key)
+		_DIAMOND_CACHE[key] = img
+	return img
+
+
+# Bold score text and its centered x keyed by (away score, home score).
+_SCORE_CACHE: Dict[Tuple[object, object], Tuple[str, int]] = {}
+
+
+def _score_text(away_score, home_score) -> Tuple[str, int]:
+	"""Return the "A-H" score (max 9 chars) and its x for the 6px bold font."""
+	key = (away_score, home_score)
+	hit = _SCORE_CACHE.get(key)
+	if hit is None:
+		text = f"{away_score}-{home_score}"[:9]
+		hit = _SCORE_CACHE[key] = (text, center_x_width(text, 6))
+	return hit
+
+
+def _ensure_fonts():
+	"""Load the tiny and bold fonts once; WHITE needs no gamma (LUT[255] == 255)."""
+	global _FONT, _BOLD_FONT
+	if _FONT is None:
+		_FONT = FontManager.get_font()
+		_BOLD_FONT = FontManager.get_font(bold=True)
+
+
+_BIG_LOGO = 26  # big side-logo layout (nominal target height)
+_MED_LOGO = 18  # pre-game corner logos
+# Both big logos composited into one 64x32 frame per matchup, keyed like team_logo's cache.
+_BACKDROP_CACHE: Dict[Tuple[str, str, bool], object] = {}
+
+
+def _matchup_backdrop(away, home, gamma_correct: bool = False):
+	"""Return the big-layout logo pair as a single SetImage-ready frame (None if a logo is missing)."""
+	key = (away.abbr, home.abbr, gamma_correct)
+	frame = _BACKDROP_CACHE.get(key)
+	if frame is None:
+		left = team_logo('mlb', away, _BIG_LOGO, gamma_correct)
+		right = team_logo('mlb', home, _BIG_LOGO, gamma_correct)
+		if left is None or right is None:
+			return None
+		frame = Image.new('RGB', (64, 32))
+		# Same placement as the per-logo draw: 4px down, clipped at the panel edges
+		frame.paste(left, (-6, 4))
+		frame.paste(right, (64 - (_BIG_LOGO - 6), 4))
+		_BACKDROP_CACHE[key] = frame
+	return frame
+
+
+def preload_logos(games: Iterable[MLBGame], *, gamma_correct: bool = False):
+	"""Resolve every layout logo up front so render_game never hits disk or network."""
+	for g in games:
+		size = _MED_LOGO if (g.state or '') == 'pre' else _BIG_LOGO  # pre-game uses the medium layout
+		for team in (g.away, g.home):
+			team_logo('mlb', team, size, gamma_correct)
+
+
+def _fit_name(name: str, max_px: int) -> str:
+	"""Fit a pitcher name inside max_px using 4px tiny font glyphs."""
+	if not name or max_px <= 0:
+		return ''
+	name = name.upper()
+	char_w = 4
+	if len(name) * char_w <= max_px:
+		return name
+	# Try last segment (after space or hyphen)
+	segments = re.split(r"[\s-]+", name)
+	if segments:
+		last_seg = segments[-1]
+		if len(last_seg) * char_w <= max_px:
+			return last_seg
+	# Remove vowels from end (except first letter)
+	core = list(last_seg)
+	vowels = set("AEIOU")
+	# Keep first letter always
+	for i in range(len(core)-1, 0, -1):
 		if len(core) * char_w <= max_px:
-			return ''.join(core)
-		# Final truncate to fit
-		max_chars = max(1, max_px // char_w)
-		return ''.join(core)[:max_chars]
-
-	# Ultra-small display handling (e.g., ~12x6). Provide compressed single-line output.
-	if width <= 20 or height <= 8:
-		from ..Screens.common import graphics, FontManager
-		font = FontManager.get_font()
-		white = gcolor(255,255,255)
-		# Build compact token: A1-H2 (first letters) plus maybe inning if room
-		a_chr = game.away.abbr[:1]
-		h_chr = game.home.abbr[:1]
-		token = f"{a_chr}{game.away.score}-{h_chr}{game.home.score}"[:width // 4]  # crude trim
-		# Try to append inning indicator if space (e.g., '5')
-		inn = str(game.period) if game.period else ''
-		if inn and len(token)*4 + 4 <= width:
-			token += inn
-		# Center horizontally
-		x = max(0, (width - len(token)*4)//2)
-		y = min(height - 1, height - 1)  # Baseline at bottom
-		graphics.DrawText(canvas, font, x, y, white, token)
-		matrix.SwapOnVSync(canvas)
-		time.sleep(hold)
-		return
+			break
+		if core[i] in vowels:
+			core.pop(i)
+	if len(core) * char_w <= max_px:
+		return ''.join(core)
+	# Final truncate to fit
+	max_chars = max(1, max_px // char_w)
+	return ''.join(core)[:max_chars]
 
-	if show_logos and big_layout and width >= 48 and height >= 24:
-		# Determine state early so we can choose layout without drawing large logos twice
-		state = game.state or ""
-		# Pre-game: dedicated medium-logo layout (skip big logos)
-		if state == 'pre':
-			from ..Screens.common import graphics, FontManager, center_x_width
-			font = FontManager.get_font()
-			white = gcolor(255,255,255)
-			MED = 18
-			l_med = get_processed_logo('mlb', game.away.abbr, url=game.away.logo, size=MED, remove_bg=True)
-			r_med = get_processed_logo('mlb', game.home.abbr, url=game.home.logo, size=MED, remove_bg=True)
-			def blit_med(img, ox, oy=0):
-				if img is None: return
-				try: has_alpha = img.mode == 'RGBA'
-				except Exception: has_alpha = False
-				w,h = img.size; pix = img.load()
-				for y2 in range(h):
-					py = oy + y2
-					if py >= height: break
-					for x2 in range(w):
-						px = ox + x2
-						if px < 0 or px >= width: continue
-						val = pix[x2,y2]
-						if has_alpha and len(val)==4:
-							r,g2,b2,a = val
-							if a < 90: continue
-						else:
-							r,g2,b2 = val[:3]
-						try: canvas.SetPixel(px, py, _gc(int(r)), _gc(int(g2)), _gc(int(b2)))
-						except Exception: pass
-			if l_med: blit_med(l_med, 0, 0)
-			if r_med: blit_med(r_med, width - r_med.size[0], 0)
-			def last_name(obj, role: str):
-				"""Extract probable pitcher's last name from various possible structures.
-				Supports attributes or dict keys: probable_pitcher, starting_pitcher, pitcher, probablePitcher, probables(list).
-				Adds heuristic scan of any attribute/key containing 'pitch'."""
-				# 1. Direct attributes/dict entries
-				candidates = []
-				for attr in ("probable_pitcher", "starting_pitcher", "pitcher", "probablePitcher"):
-					val = getattr(obj, attr, None)
-					if not val and isinstance(obj, dict):
-						val = obj.get(attr)
-					if val:
-						candidates.append(val)
-				# 1b. Heuristic scan for ANY attribute/key containing 'pitch'
-				try:
-					for attr_name in dir(obj):
-						if 'pitch' in attr_name.lower():
-							val = getattr(obj, attr_name, None)
-							if val and val not in candidates:
-								candidates.append(val)
-				except Exception:
-					pass
-				if isinstance(obj, dict):
-					for k,v in obj.items():
-						if isinstance(k,str) and 'pitch' in k.lower():
-							if v and v not in candidates:
-								candidates.append(v)
-				# 2. Probables list (ESPn style): obj.probables -> list of dicts with athlete.fullName / displayName
-				prob_list = getattr(obj, 'probables', None)
-				if not prob_list and isinstance(obj, dict):
-					prob_list = obj.get('probables')
-				if isinstance(prob_list, (list, tuple)) and prob_list:
-					for item in prob_list:
-						if not isinstance(item, dict):
-							continue
-						ath = item.get('athlete') or {}
-						if isinstance(ath, dict):
-							full = ath.get('fullName') or ath.get('displayName') or ath.get('shortName')
-							if full:
-								candidates.append(full)
-						else:
-							# maybe item itself has displayName
-							dsp = item.get('displayName') or item.get('fullName')
-							if dsp:
-								candidates.append(dsp)
-				# 2b. Fallback: search raw competitors structure if still empty
-				if not candidates:
-					raw = getattr(game, 'raw', {}) or {}
-					comps = []
-					# ESPN style sometimes under competitions[0].competitors
-					if isinstance(raw, dict):
-						if 'competitors' in raw:
-							comps = raw.get('competitors') or []
-						elif 'competitions' in raw:
-							try:
-								comps = (raw['competitions'][0] or {}).get('competitors', [])
-							except Exception:
-								comps = []
-					if isinstance(comps, list):
-						for c in comps:
-							if not isinstance(c, dict):
-								continue
-							if c.get('homeAway') != role:
-								continue
-							# look in competitor probables
-							plist = c.get('probables') or []
-							for item in plist:
-								if not isinstance(item, dict):
-									continue
-								ath = item.get('athlete') or {}
-								if isinstance(ath, dict):
-									full = ath.get('fullName') or ath.get('displayName') or ath.get('shortName')
-									if full:
-										candidates.append(full)
-								else:
-									# direct item names
-									full = item.get('displayName') or item.get('fullName')
-									if full:
-										candidates.append(full)
-				# 3. Reduce candidates to last name
-				for name in candidates:
-					if not name:
-						continue
-					# Nested dict candidate
-					if isinstance(name, dict):
-						for k in ("last_name","lname","name_last","last"):
-							if k in name and name[k]:
-								ln = str(name[k]).split()[-1]
-								return ln[:8].upper()
-						for k in ("display","full","name"):
-							if k in name and name[k]:
-								ln = str(name[k]).split()[-1]
-								return ln[:8].upper()
-					elif isinstance(name, str):
-						parts = name.strip().split()
-						if parts:
-							return parts[-1][:8].upper()
-				return ""
-			away_p = last_name(game.away, 'away'); home_p = last_name(game.home, 'home')
-			if not away_p: away_p = '?'
-			if not home_p: home_p = '?'
-			try:
-				print('[PITCH DBG pre-medium]', 'away', away_p, 'home', home_p)
-			except Exception:
-				pass
-			# Adjusted vertical positioning: pitcher names moved down 3px, time down 1-2px (clamped to panel)
-			name_y = min(height - 3, MED + 4)  # MED base + 4 (was +1)
-			if l_med and away_p and away_p != '?':
-				w_logo = l_med.size[0]
-				name_txt = _fit_name(away_p, w_logo)
-				px = max(0, (w_logo - len(name_txt)*4)//2)
-				graphics.DrawText(canvas, font, px, name_y, white, name_txt)
-			if r_med and home_p and home_p != '?':
-				w_logo = r_med.size[0]
-				name_txt = _fit_name(home_p, w_logo)
-				start_x = width - w_logo + max(0, (w_logo - len(name_txt)*4)//2)
-				graphics.DrawText(canvas, font, start_x, name_y, white, name_txt)
-			# New layout: time at top center, venue scrolls across bottom.
-			bold_font = FontManager.get_font(bold=True)
-			start_iso = getattr(game, 'start_time', None) or game.start_time
-			show_time = _format_local_start_time(start_iso) or 'TBD'
-			# Draw static elements each frame; animate venue scroll.
-			venue = (getattr(game, 'venue', '') or '').strip()
-			if not venue:
-				venue = f"{game.away.abbr} @ {game.home.abbr}"  # fallback
-			scroll_text = f"  {venue.upper()}  "
-			# Estimate total scroll width in pixels (4px per char)
-			char_w = 4
-			text_px = len(scroll_text) * char_w
-			loop_px = text_px + width
-			# Frame timing (run full scroll irrespective of requested hold so full venue shows)
-			step_delay = 0.08
-			frames_needed = loop_px  # shift one pixel per frame across entire text + screen width
-			frames = frames_needed
-			for frame in range(frames):
-				canvas.Clear()
-				# Redraw logos
-				if l_med: blit_med(l_med, 0, 0)
-				if r_med: blit_med(r_med, width - r_med.size[0], 0)
-				# Pitcher names (static)
-				if l_med and away_p and away_p != '?':
-					w_logo = l_med.size[0]
-					name_txt = _fit_name(away_p, w_logo)
-					px = max(0, (w_logo - len(name_txt)*char_w)//2)
-					graphics.DrawText(canvas, font, px, name_y, white, name_txt)
-				if r_med and home_p and home_p != '?':
-					w_logo = r_med.size[0]
-					name_txt = _fit_name(home_p, w_logo)
-					start_x = width - w_logo + max(0, (w_logo - len(name_txt)*char_w)//2)
-					graphics.DrawText(canvas, font, start_x, name_y, white, name_txt)
-				# Time lowered slightly for 32px panel so glyph not clipped by logos
-				mx_time = center_x_width(show_time, 6)
-				time_y = 9
-				graphics.DrawText(canvas, bold_font, mx_time, time_y, white, show_time)
-				# Scroll venue along bottom (baseline y=31) using small font
-				offset = frame % loop_px
-				# Starting draw x = width - offset
-				start_x_px = width - offset
-				# Render each character
-				for idx, ch in enumerate(scroll_text):
-					cx = start_x_px + idx*char_w
-					if cx < -char_w or cx >= width: continue
-					graphics.DrawText(canvas, font, cx, height - 1, white, ch)
-				canvas = matrix.SwapOnVSync(canvas)
-				time.sleep(step_delay)
-			return
-
-		# Big side logo layout (non pre-game states)
-		BIG = 26  # nominal target height
-		left_img = get_processed_logo('mlb', game.away.abbr, url=game.away.logo, size=BIG, remove_bg=True)
-		right_img = get_processed_logo('mlb', game.home.abbr, url=game.home.logo, size=BIG, remove_bg=True)
-		# Draw with partial off-screen effect via per-pixel plot
-		def blit(img, ox):
-			if img is None:
-				return
-			try:
-				has_alpha = img.mode == 'RGBA'
-			except Exception:
-				has_alpha = False
-			w, h = img.size
-			pix = img.load()
-			for y in range(h):
-				py = y + 4  # push logos down to free top rows for text
-				if py >= 32:
-					break
-				for x in range(w):
-					px = x + ox
-					if px < 0 or px >= 64:
-						continue
-					val = pix[x, y]
-					if has_alpha and len(val) == 4:
-						r, g, b, a = val
-						if a < 90:  # skip mostly transparent feather pixels
-							continue
-					else:
-						r, g, b = val[:3]
-					try:
-						canvas.SetPixel(px, py, _gc(int(r)), _gc(int(g)), _gc(int(b)))  # type: ignore[attr-defined]
-					except Exception:
-						pass
-		# Left & right logos (slightly shifted)
-		blit(left_img, -6)
-		if right_img:
-			blit(right_img, 64 - (BIG - 6))
-		from ..Screens.common import graphics, FontManager, center_x, center_x_width, draw_text_small_bold
-		font = FontManager.get_font()  # base tiny font
-		bold_font = FontManager.get_font(bold=True)  # taller real bold for score
-		white = gcolor(255,255,255)
-		state = game.state or ""
-		# Pre-game: show only logos + @time
-		if state == 'pre':
-			# New pre-game layout: medium logos top corners, probable pitcher last names under logos,
-			# bold start time bottom center.
-			MED = 18
-			# Re-fetch smaller logos for this layout to reduce vertical footprint
-			l_med = get_processed_logo('mlb', game.away.abbr, url=game.away.logo, size=MED, remove_bg=True)
-			r_med = get_processed_logo('mlb', game.home.abbr, url=game.home.logo, size=MED, remove_bg=True)
-			def blit_med(img, ox, oy=0):
-				if img is None:
-					return
-				try:
-					has_alpha = img.mode == 'RGBA'
-				except Exception:
-					has_alpha = False
-				w,h = img.size
-				pix = img.load()
-				for y2 in range(h):
-					py = oy + y2
-					if py >= height: break
-					for x2 in range(w):
-						px = ox + x2
-						if px < 0 or px >= width: continue
-						val = pix[x2,y2]
-						if has_alpha and len(val)==4:
-							r,g2,b2,a = val
-							if a < 90: continue
-						else:
-							r,g2,b2 = val[:3]
-						try:
-							canvas.SetPixel(px, py, _gc(int(r)), _gc(int(g2)), _gc(int(b2)))
-						except Exception:
-							pass
-		# Position logos: left at x=0, right at width - logo_w
-			if l_med:
-				blit_med(l_med, 0, 0)
-			if r_med:
-				blit_med(r_med, width - r_med.size[0], 0)
-			# Probable pitcher last names (fallback if not available)
-			def last_name(obj, role: str):
-				candidates = []
-				for attr in ("probable_pitcher", "starting_pitcher", "pitcher", "probablePitcher"):
-					val = getattr(obj, attr, None)
-					if not val and isinstance(obj, dict):
-						val = obj.get(attr)
-					if val:
-						candidates.append(val)
-				try:
-					for attr_name in dir(obj):
-						if 'pitch' in attr_name.lower():
-							val = getattr(obj, attr_name, None)
-							if val and val not in candidates:
-								candidates.append(val)
-				except Exception:
-					pass
-				if isinstance(obj, dict):
-					for k,v in obj.items():
-						if isinstance(k,str) and 'pitch' in k.lower():
-							if v and v not in candidates:
-								candidates.append(v)
-				prob_list = getattr(obj, 'probables', None)
-				if not prob_list and isinstance(obj, dict):
-					prob_list = obj.get('probables')
-				if isinstance(prob_list, (list, tuple)) and prob_list:
-					for item in prob_list:
-						if not isinstance(item, dict):
-							continue
-						ath = item.get('athlete') or {}
-						if isinstance(ath, dict):
-							full = ath.get('fullName') or ath.get('displayName') or ath.get('shortName')
-							if full:
-								candidates.append(full)
-						else:
-							dsp = item.get('displayName') or item.get('fullName')
-							if dsp:
-								candidates.append(dsp)
-				if not candidates:
-					raw = getattr(game, 'raw', {}) or {}
-					comps = []
-					if isinstance(raw, dict):
-						if 'competitors' in raw:
-							comps = raw.get('competitors') or []
-						elif 'competitions' in raw:
-							try:
-								comps = (raw['competitions'][0] or {}).get('competitors', [])
-							except Exception:
-								comps = []
-					if isinstance(comps, list):
-						for c in comps:
-							if not isinstance(c, dict): continue
-							if c.get('homeAway') != role: continue
-							plist = c.get('probables') or []
-							for item in plist:
-								if not isinstance(item, dict): continue
-								ath = item.get('athlete') or {}
-								if isinstance(ath, dict):
-									full = ath.get('fullName') or ath.get('displayName') or ath.get('shortName')
-									if full: candidates.append(full)
-								else:
-									full = item.get('displayName') or item.get('fullName')
-									if full: candidates.append(full)
-				for name in candidates:
-					if not name: continue
-					if isinstance(name, dict):
-						for k in ("last_name","lname","name_last","last"):
-							if k in name and name[k]:
-								ln = str(name[k]).split()[-1]
-								return ln[:8].upper()
-						for k in ("display","full","name"):
-							if k in name and name[k]:
-								ln = str(name[k]).split()[-1]
-								return ln[:8].upper()
-					elif isinstance(name, str):
-						parts = name.strip().split()
-						if parts:
-							return parts[-1][:8].upper()
-				return ""
-			away_p = last_name(game.away, 'away')
-			home_p = last_name(game.home, 'home')
-			if not away_p: away_p = '?'
-			if not home_p: home_p = '?'
-			try:
-				print('[PITCH DBG pre-big]', 'away', away_p, 'home', home_p)
-			except Exception:
-				pass
-			# Font metrics: tiny font char width 4 -> center under each logo width
-			# Adjusted vertical positioning consistent with medium pre layout
-			name_y = min(height - 3, MED + 4)
-			if l_med and away_p and away_p != '?':
-				w_logo = l_med.size[0]
-				name_txt = _fit_name(away_p, w_logo)
-				px = max(0, (w_logo - len(name_txt)*4)//2)
-				graphics.DrawText(canvas, font, px, name_y, white, name_txt)
-			if r_med and home_p and home_p != '?':
-				w_logo = r_med.size[0]
-				name_txt = _fit_name(home_p, w_logo)
-				start_x = width - w_logo + max(0, (w_logo - len(name_txt)*4)//2)
-				graphics.DrawText(canvas, font, start_x, name_y, white, name_txt)
-			# New big pre-game layout: scrolling venue bottom, time top center
-			bold_font = FontManager.get_font(bold=True)
-			start_iso = getattr(game, 'start_time', None) or game.start_time
-			show_time = _format_local_start_time(start_iso) or 'TBD'
-			venue = (getattr(game, 'venue', '') or '').strip()
-			if not venue:
-				venue = f"{game.away.abbr} @ {game.home.abbr}"
-			scroll_text = f"  {venue.upper()}  "
-			char_w = 4
-			text_px = len(scroll_text) * char_w
-			loop_px = text_px + width
-			step_delay = 0.08
-			frames_needed = loop_px
-			frames = frames_needed
-			for frame in range(frames):
-				canvas.Clear()
-				# Re-draw logos
-				if l_med: blit_med(l_med, 0, 0)
-				if r_med: blit_med(r_med, width - r_med.size[0], 0)
-				# Pitcher names
-				if l_med and away_p and away_p != '?':
-					w_logo = l_med.size[0]
-					name_txt = _fit_name(away_p, w_logo)
-					px = max(0, (w_logo - len(name_txt)*char_w)//2)
-					graphics.DrawText(canvas, font, px, name_y, white, name_txt)
-				if r_med and home_p and home_p != '?':
-					w_logo = r_med.size[0]
-					name_txt = _fit_name(home_p, w_logo)
-					start_x = width - w_logo + max(0, (w_logo - len(name_txt)*char_w)//2)
-					graphics.DrawText(canvas, font, start_x, name_y, white, name_txt)
-				# Time lowered for visibility
-				mx_time = center_x_width(show_time, 6)
-				graphics.DrawText(canvas, bold_font, mx_time, 10, white, show_time)
-				# Scroll venue bottom
-				offset = frame % loop_px
-				start_x_px = width - offset
-				for idx, ch in enumerate(scroll_text):
-					cx = start_x_px + idx*char_w
-					if cx < -char_w or cx >= width: continue
-					graphics.DrawText(canvas, font, cx, height - 1, white, ch)
-				canvas = matrix.SwapOnVSync(canvas)
-				time.sleep(step_delay)
-			return
-		# Final: logos + score + FINAL
-		if state == 'post':
-			score_combo = f"{game.away.score}-{game.home.score}"[:9]
-			mxs = center_x_width(score_combo, 6)
-			# Bold score baseline y=13 (keeps full 13px glyph visible: rows 1..13)
-			graphics.DrawText(canvas, bold_font, mxs, 13, white, score_combo)
-			final_txt = "FINAL"
-			mxf = center_x_width(final_txt, 6)
-			# FINAL at bottom baseline (31)
-			graphics.DrawText(canvas, bold_font, mxf, height - 1, white, final_txt)
-			canvas = matrix.SwapOnVSync(canvas)
-			time.sleep(hold)
-			return
-		# In-progress layout (robust inning half extraction + reliable arrow)
-		# 1. Determine inning + half robustly using processed fields
-		display_inning = (game.raw.get('display_inning') or '').strip()
-		# display_inning expected like 'T5' / 'B5' (our processor) or 'In 5'
-		half_side = ''  # 'top' or 'bot'
-		inning_num = ''
-		if display_inning.startswith('T') and display_inning[1:].isdigit():
-			half_side = 'top'
-			inning_num = display_inning[1:]
-		elif display_inning.startswith('B') and display_inning[1:].isdigit():
-			half_side = 'bot'
-			inning_num = display_inning[1:]
-		else:
-			# Fallbacks
-			model_half = (game.half or '').lower()
-			if model_half.startswith('top'): half_side = 'top'
-			elif model_half.startswith('bot') or model_half.startswith('bottom'): half_side = 'bot'
-			if game.period: inning_num = str(game.period)
-		# Final safety: parse any digits out if still blank
-		if not inning_num:
-			digits = ''.join(ch for ch in display_inning if ch.isdigit())
-			if digits: inning_num = digits
-		# 2. Render TOP/BOT label (always ALL CAPS for consistency)
-		if half_side == 'top': half_label = 'TOP'
-		elif half_side == 'bot': half_label = 'BOT'
-		else: half_label = ''
-		state_line = f"{half_label} {inning_num}".strip()
-		if state_line:
-			mx = center_x(state_line[:10])
-			# Inning/half line regular font
-			graphics.DrawText(canvas, font, mx, 5, white, state_line[:10])
-		# 3. Arrow: place next to batting team's logo (away: left side, home: right side)
-		#    Direction: point inward toward the field/text.
-		if half_side:
-			arrow_y = 13
-			if half_side == 'top':  # Away batting
-				arrow_char = '>'  # point toward center from left logo
-				arrow_x = 31  # tuned horizontal position; adjust if needed
-			else:  # bottom -> home batting
-				arrow_char = '<'
-				arrow_x = 33  # a few pixels left of right logo cluster
-			# try:
-			# 	canvas.SetPixel(arrow_x, arrow_y, 255,255,255)  # anchor pixel to ensure visibility on some fonts
-			# except Exception:
-			# 	pass
-			# Arrow small bold (horizontal embolden)
-			draw_text_small_bold(canvas, font, arrow_x, arrow_y, white, arrow_char)
-		# (Old centered arrow removed)
-		# Bases diamond centered around (31,18) (shifted left 1) + outs dots above
-		b1,b2,b3 = game.bases
-		# Occupied base color changed to red per request
-		occ = (255,0,0)
-		emp = (60,60,60)
-		def setp(x,y,color):
-			try: canvas.SetPixel(x,y,*color)
-			except Exception: pass
-		base_center_x = 31
-		base_center_y = 18
-		outs_val = game.raw.get('outs') if isinstance(game.raw.get('outs'), int) else 0
-		for i in range(3):
-			dot_x = base_center_x - 2 + i*2
-			dot_y = base_center_y - 4
-			color = (255,0,0) if i < outs_val else (70,70,70)
-			setp(dot_x, dot_y, color)
-		setp(base_center_x, base_center_y-2, occ if b2 else emp)      # Second
-		setp(base_center_x+2, base_center_y, occ if b1 else emp)      # First
-		setp(base_center_x-2, base_center_y, occ if b3 else emp)      # Third
-		setp(base_center_x, base_center_y+2, (180,180,180))           # Home
-		for (dx,dy) in [(-1,-1),(0,-2),(1,-1),(2,0),(1,1),(0,2),(-1,1),(-2,0)]:
-			setp(base_center_x+dx, base_center_y+dy, (40,40,40))
-		# Score line (use real bold font) centered with 6px glyph width at row 31
-		score_combo = f"{game.away.score}-{game.home.score}"[:9]
-		mxs = center_x_width(score_combo, 6)
-		graphics.DrawText(canvas, bold_font, mxs, 31, white, score_combo)
-		# Batter/Pitcher not shown now (removed abbreviations per request)
+
+@lru_cache(maxsize=128)
+def _tiny_token(away_abbr, away_score, home_abbr, home_score, period, width: int) -> Tuple[str, int]:
+	"""Compact 'A1-H2' token (plus inning when it fits) and its centered x for tiny panels."""
+	# First letters and scores, crudely trimmed to the panel width
+	token = f"{away_abbr[:1]}{away_score}-{home_abbr[:1]}{home_score}"[:width // 4]
+	# Try to append inning indicator if space (e.g., '5')
+	inn = str(period) if period else ''
+	if inn and len(token)*4 + 4 <= width:
+		token += inn
+	return token, max(0, (width - len(token)*4)//2)
+
+
+def _render_small(matrix, canvas, game: MLBGame, width: int, height: int, **_) -> bool:
+	"""Ultra-small display handling (e.g., ~12x6). Provide compressed single-line output.
+
+	Returns True like _render_normal; the caller owns the hold sleep."""
+	_ensure_fonts()
+	font = _FONT
+	white = WHITE
+	token, x = _tiny_token(game.away.abbr, game.away.score, game.home.abbr, game.home.score, game.period, width)
+	y = min(height - 1, height - 1)  # Baseline at bottom
+	graphics.DrawText(canvas, font, x, y, white, token)
+	swap_canvas(matrix, canvas)
+	return True
+
+
+def _render_pre(matrix, canvas, game: MLBGame, width: int, height: int, gamma_correct: bool = False) -> bool:
+	"""Pre-game: medium corner logos, probable pitchers, start time and a venue scroll."""
+	_ensure_fonts()
+	font = _FONT
+	white = WHITE  # gamma maps 255 to 255, so one color serves both paths
+	MED = _MED_LOGO
+	l_med = team_logo('mlb', game.away, MED, gamma_correct)
+	r_med = team_logo('mlb', game.home, MED, gamma_correct)
+	away_p, home_p = game.pitcher_names()
+	# Adjusted vertical positioning: pitcher names moved down 3px, time down 1-2px (clamped to panel)
+	name_y = min(height - 3, MED + 4)  # MED base + 4 (was +1)
+	# Static text is laid out once; only the venue moves between frames.
+	char_w = 4
+	names = []  # (x, text) for pitcher names under each logo
+	if l_med and away_p and away_p != '?':
+		w_logo = l_med.size[0]
+		name_txt = _fit_name(away_p, w_logo)
+		names.append((max(0, (w_logo - len(name_txt)*char_w)//2), name_txt))
+	if r_med and home_p and home_p != '?':
+		w_logo = r_med.size[0]
+		name_txt = _fit_name(home_p, w_logo)
+		names.append((width - w_logo + max(0, (w_logo - len(name_txt)*char_w)//2), name_txt))
+	# New layout: time at top center, venue scrolls across bottom.
+	bold_font = _BOLD_FONT
+	start_iso = getattr(game, 'start_time', None) or game.start_time
+	show_time = _format_local_start_time(start_iso) or 'TBD'
+	# Time lowered slightly for 32px panel so glyph not clipped by logos
+	mx_time = center_x_width(show_time, 6)
+	time_y = 9
+	venue = (getattr(game, 'venue', '') or '').strip()
+	if not venue:
+		venue = f"{game.away.abbr} @ {game.home.abbr}"  # fallback
+	scroll_text = f"  {venue.upper()}  "
+	# Estimate total scroll width in pixels (4px per char)
+	text_px = len(scroll_text) * char_w
+	loop_px = text_px + width
+	# Frame timing (run full scroll irrespective of requested hold so full venue shows)
+	step_delay = 0.08
+	frames_needed = loop_px  # shift one pixel per frame across entire text + screen width
+	frames = frames_needed
+	deadline = time.monotonic()
+	for frame in range(frames):
+		canvas.Clear()
+		# Redraw logos
+		blit_corner_logos(canvas, l_med, r_med, width, height)
+		# Pitcher names (static)
+		for px, name_txt in names:
+			graphics.DrawText(canvas, font, px, name_y, white, name_txt)
+		graphics.DrawText(canvas, bold_font, mx_time, time_y, white, show_time)
+		# Scroll venue along bottom (baseline y=31) using small font
+		offset = frame % loop_px
+		# Starting draw x = width - offset
+		start_x_px = width - offset
+		# Render only the characters on screen
+		draw_scroll_text(canvas, font, start_x_px, height - 1, white, scroll_text, char_w, width)
+		canvas = swap_canvas(matrix, canvas)
+		deadline = pace_frame(deadline, step_delay)
+	return False  # the venue scroll already ran its own timing
+
+
+def _draw_big_logos(canvas, away, home, gamma_correct: bool = False):
+	"""Big side logos (post and in-progress layouts), clipped at the panel edges."""
+	BIG = _BIG_LOGO
+	backdrop = _matchup_backdrop(away, home, gamma_correct)
+	if backdrop is not None:
+		blit_logo(canvas, backdrop, 0, 0, 64, 32)
 	else:
-		# Fallback layout (manually draw with gamma-corrected text if requested)
-		lines_raw = game_leaders_lines(game) if leaders else game_primary_lines(game)
-		lines = prepare_lines(lines_raw, max_lines=4, max_chars=15)
-		from ..Screens.common import graphics, FontManager, center_x, draw_text_small_bold
-		font = FontManager.get_font()
-		white = gcolor(255,255,255)
-		start_y = 6
-		line_height = 8
-		y = start_y
-		for line in lines:
-			mx = center_x(line)
-			draw_text_small_bold(canvas, font, mx, y, white, line)
-			y += line_height
-	canvas = matrix.SwapOnVSync(canvas)
-	time.sleep(hold)
+		# A logo is missing; draw whichever one we have
+		left_img = team_logo('mlb', away, BIG, gamma_correct)
+		right_img = team_logo('mlb', home, BIG, gamma_correct)
+		# Left & right logos slightly shifted (clipped at the panel edges), pushed
+		# down 4px to free top rows for text
+		blit_logo(canvas, left_img, -6, 4, 64, 32)
+		blit_logo(canvas, right_img, 64 - (BIG - 6), 4, 64, 32)
+
+
+def _render_post(matrix, canvas, game: MLBGame, width: int, height: int, gamma_correct: bool = False) -> bool:
+	"""Final: big logos + score + FINAL."""
+	away, home = game.away, game.home
+	_draw_big_logos(canvas, away, home, gamma_correct)
+	_ensure_fonts()
+	bold_font = _BOLD_FONT  # taller real bold for score
+	white = WHITE
+	score_combo, mxs = _score_text(away.score, home.score)
+	# Bold score baseline y=13 (keeps full 13px glyph visible: rows 1..13)
+	graphics.DrawText(canvas, bold_font, mxs, 13, white, score_combo)
+	final_txt = "FINAL"
+	mxf = center_x_width(final_txt, 6)
+	# FINAL at bottom baseline (31)
+	graphics.DrawText(canvas, bold_font, mxf, height - 1, white, final_txt)
+	swap_canvas(matrix, canvas)
+	return True
+
+
+def _render_in_progress(matrix, canvas, game: MLBGame, width: int, height: int, gamma_correct: bool = False) -> bool:
+	"""In-progress: big logos, inning/half, batting arrow, bases diamond and score."""
+	# Bind the per-game fields used below once
+	away, home, raw = game.away, game.home, game.raw
+	_draw_big_logos(canvas, away, home, gamma_correct)
+	_ensure_fonts()
+	font = _FONT  # base tiny font
+	bold_font = _BOLD_FONT  # taller real bold for score
+	white = WHITE
+	# In-progress layout (robust inning half extraction + reliable arrow)
+	# 1. Inning + half, parsed once per game on the model ('TOP 5', 'BOT 7', ...)
+	half_side, state_line = game.inning_info()
+	# 2. Render TOP/BOT label (always ALL CAPS for consistency)
+	if state_line:
+		mx = center_x(state_line[:10])
+		# Inning/half line regular font
+		graphics.DrawText(canvas, font, mx, 5, white, state_line[:10])
+	# 3. Arrow: place next to batting team's logo (away: left side, home: right side)
+	#    Direction: point inward toward the field/text.
+	if half_side:
+		arrow_y = 13
+		if half_side == 'top':  # Away batting
+			arrow_char = '>'  # point toward center from left logo
+			arrow_x = 31  # tuned horizontal position; adjust if needed
+		else:  # bottom -> home batting
+			arrow_char = '<'
+			arrow_x = 33  # a few pixels left of right logo cluster
+		# Arrow small bold (horizontal embolden)
+		draw_text_small_bold(canvas, font, arrow_x, arrow_y, white, arrow_char)
+	# Bases diamond centered around (31,18) (shifted left 1) + outs dots above
+	b1,b2,b3 = game.bases
+	base_center_x = 31
+	base_center_y = 18
+	outs_val = raw.get('outs')
+	if not isinstance(outs_val, int):
+		outs_val = 0
+	if Image is not None:
+		# One SetImage of the cached patch instead of ~15 SetPixel calls
+		blit_logo(canvas, _diamond_image(b1, b2, b3, outs_val), base_center_x - 2, base_center_y - 4, width, height)
+	else:
+		def setp(x,y,color):
+			# Explicit clip instead of a try/except around every pixel
+			if 0 <= x < width and 0 <= y < height:
+				canvas.SetPixel(x, y, color[0], color[1], color[2])
+		_draw_diamond(setp, base_center_x, base_center_y, b1, b2, b3, outs_val)
+	# Score line (use real bold font) centered with 6px glyph width at row 31
+	score_combo, mxs = _score_text(away.score, home.score)
+	graphics.DrawText(canvas, bold_font, mxs, 31, white, score_combo)
+	# Batter/Pitcher not shown now (removed abbreviations per request)
+	swap_canvas(matrix, canvas)
+	return True
+
+
+def _render_fallback(matrix, canvas, game: MLBGame, width: int, height: int, leaders: bool = False) -> bool:
+	"""Text-only layout (logos off or panel too small for them)."""
+	lines_raw = game_leaders_lines(game) if leaders else game_primary_lines(game)
+	lines = prepare_lines(lines_raw, max_lines=4, max_chars=15)
+	_ensure_fonts()
+	font = _FONT
+	white = WHITE  # gamma maps 255 to 255, so one color serves both paths
+	start_y = 6
+	line_height = 8
+	y = start_y
+	for line in lines:
+		mx = center_x(line)
+		draw_text_small_bold(canvas, font, mx, y, white, line)
+		y += line_height
+	swap_canvas(matrix, canvas)
+	return True
+
+
+# Big-layout renderer per game state; any other state (in, delayed, ...) uses the in-progress layout.
+_BIG_LAYOUTS = {'pre': _render_pre, 'post': _render_post}
+
+
+def _render_normal(matrix, canvas, game: MLBGame, width: int, height: int, leaders: bool = False, show_logos: bool = True, big_layout: bool = True, gamma_correct: bool = False) -> bool:
+	"""Draw one game on a regular panel; True means a static frame is up and should be held."""
+	if show_logos and big_layout and width >= 48 and height >= 24:
+		return _BIG_LAYOUTS.get(game.state or "", _render_in_progress)(matrix, canvas, game, width, height, gamma_correct)
+	return _render_fallback(matrix, canvas, game, width, height, leaders)
+
+
+def _renderer_for(width: int, height: int):
+	"""Pick the layout function for a panel once; the size never changes at runtime."""
+	return _render_small if width <= 20 or height <= 8 else _render_normal
+
+
+def render_game(matrix, game: MLBGame, leaders: bool = False, hold: float = 2.5, show_logos: bool = True, big_layout: bool = True, gamma_correct: bool = False, width: int | None = None, height: int | None = None):
+	canvas = frame_canvas(matrix)
+	# Detect actual canvas size (fallback to assumed 64x32) unless the caller already probed it
+	if width is None or height is None:
+		width, height = panel_size(canvas)
+	if _renderer_for(width, height)(matrix, canvas, game, width, height, leaders=leaders, show_logos=show_logos, big_layout=big_layout, gamma_correct=gamma_correct):
+		time.sleep(hold)
 
 
 def cycle_games(matrix, games: Iterable[MLBGame], *, show_leaders: bool = False, per_game_seconds: float = 3.0, pre_game_seconds: float = 3.0, show_logos: bool = True, gamma_correct: bool = False):
@@ -650,11 +395,26 @@ def cycle_games(matrix, games: Iterable[MLBGame], *, show_leaders: bool = False,
 	per_game_seconds: default hold time for in-progress / post games.
 	pre_game_seconds: faster hold for pre-game matchups so they rotate more quickly.
 	"""
-	for g in games:
-		# Choose faster duration for pre-game
-		base_hold = pre_game_seconds if (getattr(g, 'state', '') == 'pre') else per_game_seconds
-		render_game(matrix, g, leaders=False, hold=base_hold, show_logos=show_logos, big_layout=show_logos, gamma_correct=gamma_correct)
-		# Leader screens disabled per request; no secondary leader frame.
-
+	games = list(games)
+	# Resolve each game's hold once (faster duration for pre-game) before drawing anything
+	width, height = panel_size(matrix)  # panel size is fixed; probe once per cycle
+	holds = [pre_game_seconds if (getattr(g, 'state', '') == 'pre') else per_game_seconds for g in games]
+	render = _renderer_for(width, height)
+	# Fetch logos on one background worker, in display order, so later games download
+	# while earlier ones are on screen instead of stalling the first frame. The small
+	# renderer never draws logos, so tiny panels skip the prefetch entirely.
+	preload = partial(preload_logos, gamma_correct=gamma_correct) if show_logos and render is _render_normal else None
+	# Holds are deadlines, not sleeps: waiting on the next game's logos counts
+	# toward the current game's hold instead of being added after it.
+	deadline = None
+	with closing(prefetched(games, preload)) as queue:
+		for g, hold in zip(queue, holds):
+			if deadline is not None:
+				time.sleep(max(0.0, deadline - time.monotonic()))
+			held = render(matrix, frame_canvas(matrix), g, width, height, leaders=False, show_logos=show_logos, big_layout=show_logos, gamma_correct=gamma_correct)
+			deadline = time.monotonic() + hold if held else None
+			# Leader screens disabled per request; no secondary leader frame.
+	if deadline is not None:
+		time.sleep(max(0.0, deadline - time.monotonic()))
 
-__all__ = ["cycle_games", "render_game"]
+__all__ = ["cycle_games", "render_game", "preload_logos"]
@@ -4,16 +4,14 @@ Enhanced pre-game layout (logos, records, time + DOW, centered odds, venue scrol
 mirrors MLB concept.
 """
 from __future__ import annotations
+import re
 import time
-from typing import Iterable, List
+from contextlib import closing
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 from datetime import datetime
-try:
-	from zoneinfo import ZoneInfo  # Python 3.9+
-except Exception:  # pragma: no cover
-	ZoneInfo = None  # type: ignore
 from ..GameClasses.nflGame import NFLGame
-from ..logo_cache import get_processed_logo
-from .common import prepare_lines, draw_frame
+from .common import graphics, Image, ZoneInfo, prepare_lines, draw_frame, panel_size, blit_logo, FontManager, WHITE, center_x_width, frame_canvas, swap_canvas, pace_frame, draw_scroll_text, zone_info, team_logo, prefetched
 
 
 def game_primary_lines(game: NFLGame) -> List[str]:
@@ -23,259 +21,281 @@ def game_primary_lines(game: NFLGame) -> List[str]:
 	return base
 
 
-def game_leaders_lines(game: NFLGame) -> List[str]:
+def game_leaders_lines(game: NFLGame) -> Tuple[str, ...]:
 	return game.leaders_lines()
 
 
-def render_game(matrix, game: NFLGame, leaders: bool = False, hold: float = 2.5, show_logos: bool = True):
-	canvas = matrix.CreateFrameCanvas()
-	width = getattr(canvas, 'width', getattr(canvas, 'GetWidth', lambda: 64)()) if hasattr(canvas, 'width') else 64
-	height = getattr(canvas, 'height', getattr(canvas, 'GetHeight', lambda: 32)()) if hasattr(canvas, 'height') else 32
-
-	# Enhanced pre-game layout similar to MLB version
-	if show_logos and (game.state or '') == 'pre' and width >= 48 and height >= 24:
-		from .common import graphics, FontManager, center_x_width
-		font = FontManager.get_font()
-		bold_font = FontManager.get_font(bold=True)
-		white = graphics.Color(255,255,255)
-		MED = 18
-		l_med = get_processed_logo('nfl', game.away.abbr, url=getattr(game.away, 'logo', None), size=MED, remove_bg=True)
-		r_med = get_processed_logo('nfl', game.home.abbr, url=getattr(game.home, 'logo', None), size=MED, remove_bg=True)
-		def blit_med(img, ox, oy=0):
-			if img is None: return
-			try: has_alpha = img.mode == 'RGBA'
-			except Exception: has_alpha = False
-			w,h = img.size; pix = img.load()
-			for y2 in range(h):
-				py = oy + y2
-				if py >= height: break
-				for x2 in range(w):
-					px = ox + x2
-					if px < 0 or px >= width: continue
-					val = pix[x2,y2]
-					if has_alpha and len(val)==4:
-						r,g2,b2,a = val
-						if a < 90: continue
-					else:
-						r,g2,b2 = val[:3]
-					try: canvas.SetPixel(px, py, int(r), int(g2), int(b2))
-					except Exception: pass
-		if l_med: blit_med(l_med, 0, 0)
-		if r_med: blit_med(r_med, width - r_med.size[0], 0)
-		# Records under logos (fit if needed, 4px char width)
-		def fit(text: str, max_px: int) -> str:
-			if not text: return ''
-			char_w = 4
-			if len(text)*char_w <= max_px: return text
-			return text[: max_px//char_w]
-		# Repositioned layout: time at 6, DOW at 12, odds centered (approx 19), records lower (~25)
-		name_y = min(height - 7, 25)
-		if l_med and game.away.record:
-			w_logo = l_med.size[0]
-			txt = fit(game.away.record, w_logo)
-			px = max(0, (w_logo - len(txt)*4)//2)
-			graphics.DrawText(canvas, font, px, name_y, white, txt)
-		if r_med and game.home.record:
-			w_logo = r_med.size[0]
-			txt = fit(game.home.record, w_logo)
-			start_x = width - w_logo + max(0, (w_logo - len(txt)*4)//2)
-			graphics.DrawText(canvas, font, start_x, name_y, white, txt)
-		# Time top center (UTC -> Eastern) - dropped additional 3px (now y=13)
-		start_iso = getattr(game, 'start_time', None) or game.start_time
-		show_time = ''
-		if isinstance(start_iso, str) and 'T' in start_iso:
-			iso_full = start_iso.strip()
-			if iso_full.endswith('Z'):
-				iso_full = iso_full[:-1] + '+00:00'
-			try:
-				dt = datetime.fromisoformat(iso_full)
-				if dt.tzinfo is None and ZoneInfo:
-					dt = dt.replace(tzinfo=ZoneInfo('UTC'))
-				if ZoneInfo:
-					local = dt.astimezone(ZoneInfo('America/New_York'))
-					show_time = f"{local.hour:02d}:{local.minute:02d}"
-				else:
-					show_time = iso_full.split('T',1)[1][:5]
-			except Exception:
-				try:
-					show_time = iso_full.split('T',1)[1][:5]
-				except Exception:
-					show_time = ''
-		if not show_time:
-			show_time = 'TBD'
-		mx_time = center_x_width(show_time, 6)
-		graphics.DrawText(canvas, bold_font, mx_time, 13, white, show_time)
-		# Day-of-week abbreviation under time
-		dow = ''
+_MED_LOGO = 18  # pre-game corner logos
+_SM_LOGO = 16  # final corner logos (slightly larger)
+# Corner logo size per state; in-progress games use the text layout.
+_STATE_LOGO = {'pre': _MED_LOGO, 'post': _SM_LOGO}
+# Both corner logos composited into one panel-sized frame per matchup, keyed by the two teams,
+# logo size and panel size; each scroll frame then starts with a single SetImage.
+_BACKDROP_CACHE: Dict[Tuple[str, str, int, int, int], object] = {}
+
+
+def _corner_backdrop(away, home, size: int, width: int, height: int):
+	"""Return the corner-logo layer as one SetImage-ready frame (None when neither logo is available)."""
+	key = (away.abbr, home.abbr, size, width, height)
+	frame = _BACKDROP_CACHE.get(key)
+	if frame is None:
+		left = team_logo('nfl', away, size)
+		right = team_logo('nfl', home, size)
+		if left is None and right is None:
+			return None
+		frame = Image.new('RGB', (width, height))
+		# Same placement as common.blit_corner_logos: top corners, clipped by paste
+		if left is not None:
+			frame.paste(left, (0, 0))
+		if right is not None:
+			frame.paste(right, (width - right.size[0], 0))
+		if left is not None and right is not None:
+			_BACKDROP_CACHE[key] = frame  # a missing logo is retried on the next render
+	return frame
+
+
+def _reset_frame(canvas, backdrop, width: int, height: int):
+	"""Start a scroll frame from the logo layer.
+
+	The backdrop is panel-sized, so its SetImage rewrites every pixel and the
+	canvas.Clear() pass is only needed when there are no logos to draw.
+	"""
+	if backdrop is None:
+		canvas.Clear()
+	else:
+		blit_logo(canvas, backdrop, 0, 0, width, height)
+
+
+def preload_logos(games: Iterable[NFLGame]):
+	"""Resolve the corner logos each game's layout needs so render_game never hits disk or network."""
+	for g in games:
+		size = _STATE_LOGO.get(g.state or '')
+		if size:
+			for team in (g.away, g.home):
+				team_logo('nfl', team, size)
+
+
+# Final-screen leader categories, in scroll order
+_LEADER_LABELS = (('passing', 'P'), ('rushing', 'RSH'), ('receiving', 'REC'))
+_YDS_RE = re.compile(r"(\d+)\s*YDS")
+_NUM_RE = re.compile(r"(\d+)")
+
+
+def _extract_yards(display: str) -> str:
+	"""Yardage number from a leader display string ('18/25, 240 YDS, 2 TD' -> '240'), else ''."""
+	if not display: return ''
+	m = _YDS_RE.search(display.upper())
+	if m: return m.group(1)
+	m2 = _NUM_RE.search(display)
+	return m2.group(1) if m2 else ''
+
+
+@lru_cache(maxsize=256)
+def _start_time_labels(start_iso) -> Tuple[str, str]:
+	"""(HH:MM Eastern, 3-letter DOW) for an ISO 8601 start time; either part is '' when unparseable.
+
+	Naive times are taken as UTC. Memoized; start times repeat every cycle.
+	"""
+	if not (isinstance(start_iso, str) and 'T' in start_iso):
+		return '', ''
+	show_time = dow = ''
+	iso_full = start_iso.strip()
+	if iso_full.endswith('Z'):
+		iso_full = iso_full[:-1] + '+00:00'
+	try:
+		dt = datetime.fromisoformat(iso_full)
+		if dt.tzinfo is None and ZoneInfo:
+			dt = dt.replace(tzinfo=zone_info('UTC'))
+		if ZoneInfo:
+			local = dt.astimezone(zone_info('America/New_York'))
+			show_time = f"{local.hour:02d}:{local.minute:02d}"
+			dow = local.strftime('%a').upper()
+		else:
+			show_time = iso_full.split('T',1)[1][:5]
+	except Exception:
+		try:
+			show_time = iso_full.split('T',1)[1][:5]
+		except Exception:
+			show_time = ''
+	if not dow:
 		try:
-			if 'local' in locals():
-				dow = local.strftime('%a').upper()
+			dow = datetime.fromisoformat(start_iso.replace('Z','+00:00')).strftime('%a').upper()
 		except Exception:
-			pass
-		if not dow and isinstance(start_iso, str) and 'T' in start_iso:
-			try:
-				from datetime import datetime as _dt
-				dt2 = _dt.fromisoformat(start_iso.replace('Z','+00:00'))
-				dow = dt2.strftime('%a').upper()
-			except Exception: dow = ''
-		if dow:
-			mx_dow = center_x_width(dow, 4)
-			# DOW dropped 4px (now y=16)
-			graphics.DrawText(canvas, font, mx_dow, 16, white, dow)
-		# Odds centered (compose concise odds line) - shifted down 5px (y=24)
-		odds = game.raw.get('odds') or {}
-		odds_line = ''
-		if isinstance(odds, dict):
-			details = odds.get('details')  # e.g. "NE -2.5"
-			ou = odds.get('overUnder')
-			if details and ou:
-				odds_line = f"{details} O/U{ou}"
-			elif details:
-				odds_line = details
-			elif ou:
-				odds_line = f"O/U {ou}"
-		# Fit odds line inside width (4px per char)
-		max_chars = width // 4
-		if len(odds_line) > max_chars:
-			odds_line = odds_line[:max_chars]
-		if odds_line:
-			mx_odds = (width - len(odds_line)*4)//2
-			graphics.DrawText(canvas, font, mx_odds, 24, white, odds_line)
-		# Venue scroll bottom
-		venue = (game.raw.get('venue') or '') or f"{game.away.abbr} @ {game.home.abbr}"
-		scroll_text = f"  {venue.upper()}  "
-		char_w = 4
-		text_px = len(scroll_text)*char_w
-		loop_px = text_px + width
-		# Faster scroll for leaders (was 0.08)
-		step_delay = 0.009
-		frames = loop_px
-		for frame in range(frames):
-			# (No clear to preserve logos each frame -> redraw for smooth scroll)
-			canvas.Clear()
-			if l_med: blit_med(l_med, 0, 0)
-			if r_med: blit_med(r_med, width - r_med.size[0], 0)
-			# Records again
-			if l_med and game.away.record:
-				w_logo = l_med.size[0]; txt = fit(game.away.record, w_logo); px = max(0, (w_logo - len(txt)*4)//2)
-				graphics.DrawText(canvas, font, px, name_y, white, txt)
-			if r_med and game.home.record:
-				w_logo = r_med.size[0]; txt = fit(game.home.record, w_logo); start_x = width - w_logo + max(0, (w_logo - len(txt)*4)//2)
-				graphics.DrawText(canvas, font, start_x, name_y, white, txt)
-			# Time & DOW (time y=13, DOW y=16)
-			graphics.DrawText(canvas, bold_font, mx_time, 9, white, show_time)
-			if dow:
-				graphics.DrawText(canvas, font, mx_dow, 15, white, dow)
-			if odds_line:
-				graphics.DrawText(canvas, font, mx_odds, 24, white, odds_line)
-			offset = frame % loop_px
-			start_x_px = width - offset
-			for idx, ch in enumerate(scroll_text):
-				cx = start_x_px + idx*char_w
-				if -char_w <= cx < width:
-					graphics.DrawText(canvas, font, cx, height - 1, white, ch)
-			canvas = matrix.SwapOnVSync(canvas)
-			time.sleep(step_delay)
-		return
-
-	# FINAL layout (post-game): small logos top corners, centered score, FINAL label, scrolling leaders bottom
-	if show_logos and (game.state or '') == 'post' and width >= 48 and height >= 24:
-		from .common import graphics, FontManager, center_x_width
-		font = FontManager.get_font()
-		bold_font = FontManager.get_font(bold=True)
-		white = graphics.Color(255,255,255)
-		SM = 16  # slightly larger logos
-		l_sm = get_processed_logo('nfl', game.away.abbr, url=getattr(game.away, 'logo', None), size=SM, remove_bg=True)
-		r_sm = get_processed_logo('nfl', game.home.abbr, url=getattr(game.home, 'logo', None), size=SM, remove_bg=True)
-		def blit_sm(img, ox, oy=0):
-			if img is None: return
-			try: has_alpha = img.mode == 'RGBA'
-			except Exception: has_alpha = False
-			w,h = img.size; pix = img.load()
-			for y2 in range(h):
-				py = oy + y2
-				if py >= height: break
-				for x2 in range(w):
-					px = ox + x2
-					if px < 0 or px >= width: continue
-					val = pix[x2,y2]
-					if has_alpha and len(val)==4:
-						r,g2,b2,a = val
-						if a < 90: continue
-					else:
-						r,g2,b2 = val[:3]
-					try: canvas.SetPixel(px, py, int(r), int(g2), int(b2))
-					except Exception: pass
-		if l_sm: blit_sm(l_sm, 0, 0)
-		if r_sm: blit_sm(r_sm, width - r_sm.size[0], 0)
-		# Centered numeric score only (no team abbreviations) mid-screen (y ~ 16)
-		score_line = f"{game.away.score}-{game.home.score}"
-		cx_score = center_x_width(score_line, 6)
-		# Keep score near top (fixed y=12) while logos remain at very top corners
-		score_y = 12
+			dow = ''
+	return show_time, dow
+
+
+def _fit(text: str, max_px: int) -> str:
+	"""Truncate text to fit max_px using 4px tiny font glyphs."""
+	if not text: return ''
+	char_w = 4
+	if len(text)*char_w <= max_px: return text
+	return text[: max_px//char_w]
+
+
+def _render_pre(matrix, canvas, game: NFLGame, width: int, height: int):
+	"""Pre-game (similar to MLB): corner logos, records, time + DOW, odds and a venue scroll."""
+	font = FontManager.get_font()
+	bold_font = FontManager.get_font(bold=True)
+	white = WHITE
+	MED = _MED_LOGO
+	l_med = team_logo('nfl', game.away, MED)
+	r_med = team_logo('nfl', game.home, MED)
+	backdrop = _corner_backdrop(game.away, game.home, MED, width, height)
+	# Everything except the venue scroll is static: lay it out once as
+	# (font, x, y, text) and replay it each frame.
+	static_text = []
+	# Records under logos (fit if needed, 4px char width)
+	# Repositioned layout: time at 6, DOW at 12, odds centered (approx 19), records lower (~25)
+	name_y = min(height - 7, 25)
+	if l_med and game.away.record:
+		w_logo = l_med.size[0]
+		txt = _fit(game.away.record, w_logo)
+		px = max(0, (w_logo - len(txt)*4)//2)
+		static_text.append((font, px, name_y, txt))
+	if r_med and game.home.record:
+		w_logo = r_med.size[0]
+		txt = _fit(game.home.record, w_logo)
+		start_x = width - w_logo + max(0, (w_logo - len(txt)*4)//2)
+		static_text.append((font, start_x, name_y, txt))
+	# Time top center (UTC -> Eastern) at y=9, day-of-week abbreviation under it
+	show_time, dow = _start_time_labels(getattr(game, 'start_time', None) or game.start_time)
+	if not show_time:
+		show_time = 'TBD'
+	mx_time = center_x_width(show_time, 6)
+	static_text.append((bold_font, mx_time, 9, show_time))
+	if dow:
+		mx_dow = center_x_width(dow, 4)
+		# DOW under the time (y=15)
+		static_text.append((font, mx_dow, 15, dow))
+	# Odds centered (compose concise odds line) - shifted down 5px (y=24)
+	odds = game.raw.get('odds') or {}
+	odds_line = ''
+	if isinstance(odds, dict):
+		details = odds.get('details')  # e.g. "NE -2.5"
+		ou = odds.get('overUnder')
+		if details and ou:
+			odds_line = f"{details} O/U{ou}"
+		elif details:
+			odds_line = details
+		elif ou:
+			odds_line = f"O/U {ou}"
+	# Fit odds line inside width (4px per char)
+	max_chars = width // 4
+	if len(odds_line) > max_chars:
+		odds_line = odds_line[:max_chars]
+	if odds_line:
+		mx_odds = (width - len(odds_line)*4)//2
+		static_text.append((font, mx_odds, 24, odds_line))
+	# Venue scroll bottom
+	venue = (game.raw.get('venue') or '') or f"{game.away.abbr} @ {game.home.abbr}"
+	scroll_text = f"  {venue.upper()}  "
+	char_w = 4
+	text_px = len(scroll_text)*char_w
+	loop_px = text_px + width
+	# Faster scroll for leaders (was 0.08)
+	step_delay = 0.009
+	frames = loop_px
+	deadline = time.monotonic()
+	for frame in range(frames):
+		_reset_frame(canvas, backdrop, width, height)
+		# Records, time, DOW and odds
+		for f, x, y, txt in static_text:
+			graphics.DrawText(canvas, f, x, y, white, txt)
+		offset = frame % loop_px
+		start_x_px = width - offset
+		draw_scroll_text(canvas, font, start_x_px, height - 1, white, scroll_text, char_w, width)
+		canvas = swap_canvas(matrix, canvas)
+		deadline = pace_frame(deadline, step_delay)
+
+
+def _render_post(matrix, canvas, game: NFLGame, width: int, height: int):
+	"""FINAL: small logos top corners, centered score, FINAL label, scrolling leaders bottom."""
+	font = FontManager.get_font()
+	bold_font = FontManager.get_font(bold=True)
+	white = WHITE
+	SM = _SM_LOGO
+	backdrop = _corner_backdrop(game.away, game.home, SM, width, height)
+	# Centered numeric score only (no team abbreviations) mid-screen (y ~ 16)
+	score_line = f"{game.away.score}-{game.home.score}"
+	cx_score = center_x_width(score_line, 6)
+	# Keep score near top (fixed y=12) while logos remain at very top corners
+	score_y = 12
+	# FINAL just below score
+	final_label = 'FINAL'
+	# Dynamically center FINAL (font assumed 4px glyph width)
+	cx_final = center_x_width(final_label, 4)
+	final_y = min(height - 9, score_y + 6)
+	# Leaders scroll bottom
+	leaders = getattr(game, 'leaders', {}) or {}
+	parts = []
+	for key, label in _LEADER_LABELS:
+		ld = leaders.get(key)
+		if ld:
+			yr = _extract_yards(ld.get('display') or '')
+			if ld.get('athlete') and yr: parts.append(f"{label}: {ld['athlete']} {yr} yds")
+	if not parts:
+		parts.append('NO LEADERS DATA')
+	scroll_text = '  '.join(parts).upper()
+	scroll_text = f"  {scroll_text}  "
+	# Use real bold font for scrolling leaders (approx 6px glyph width)
+	char_w = 6
+	loop_px = len(scroll_text)*char_w + width
+	step_delay = 0.008
+	deadline = time.monotonic()
+	for frame in range(loop_px):
+		_reset_frame(canvas, backdrop, width, height)
 		graphics.DrawText(canvas, bold_font, cx_score, score_y, white, score_line)
-		# FINAL just below score
-		final_label = 'FINAL'
-		# Dynamically center FINAL (font assumed 4px glyph width)
-		cx_final = center_x_width(final_label, 4)
-		graphics.DrawText(canvas, font, cx_final, min(height - 9, score_y + 6), white, final_label)
-		# Leaders scroll bottom
-		leaders = getattr(game, 'leaders', {}) or {}
-		def extract_yards(display: str) -> str:
-			if not display: return ''
-			import re
-			m = re.search(r"(\d+)\s*YDS", display.upper())
-			if m: return m.group(1)
-			m2 = re.search(r"(\d+)", display)
-			return m2.group(1) if m2 else ''
-		parts = []
-		if leaders.get('passing'):
-			ld = leaders['passing']; yr = extract_yards(ld.get('display') or '')
-			if ld.get('athlete') and yr: parts.append(f"P: {ld['athlete']} {yr} yds")
-		if leaders.get('rushing'):
-			ld = leaders['rushing']; yr = extract_yards(ld.get('display') or '')
-			if ld.get('athlete') and yr: parts.append(f"RSH: {ld['athlete']} {yr} yds")
-		if leaders.get('receiving'):
-			ld = leaders['receiving']; yr = extract_yards(ld.get('display') or '')
-			if ld.get('athlete') and yr: parts.append(f"REC: {ld['athlete']} {yr} yds")
-		if not parts:
-			parts.append('NO LEADERS DATA')
-		scroll_text = '  '.join(parts).upper()
-		scroll_text = f"  {scroll_text}  "
-		# Use real bold font for scrolling leaders (approx 6px glyph width)
-		char_w = 6
-		loop_px = len(scroll_text)*char_w + width
-		step_delay = 0.008
-		for frame in range(loop_px):
-			canvas.Clear()
-			if l_sm: blit_sm(l_sm, 0, 0)
-			if r_sm: blit_sm(r_sm, width - r_sm.size[0], 0)
-			graphics.DrawText(canvas, bold_font, cx_score, score_y, white, score_line)
-			graphics.DrawText(canvas, font, cx_final, min(height - 9, score_y + 6), white, final_label)
-			offset = frame % (len(scroll_text)*char_w + width)
-			start = width - offset
-			for idx,ch in enumerate(scroll_text):
-				cx = start + idx*char_w
-				if -char_w <= cx < width:
-					graphics.DrawText(canvas, bold_font, cx, height-1, white, ch)
-			canvas = matrix.SwapOnVSync(canvas)
-			time.sleep(step_delay)
-		return
-
-	# Default/simple layout (in-progress, post, or no logos)
+		graphics.DrawText(canvas, font, cx_final, final_y, white, final_label)
+		offset = frame % (len(scroll_text)*char_w + width)
+		start = width - offset
+		draw_scroll_text(canvas, bold_font, start, height-1, white, scroll_text, char_w, width)
+		canvas = swap_canvas(matrix, canvas)
+		deadline = pace_frame(deadline, step_delay)
+
+
+def _render_simple(matrix, canvas, game: NFLGame, width: int, height: int, leaders: bool = False, hold: float = 2.5):
+	"""Default text layout (in-progress, or no room/logos for the logo layouts)."""
 	lines_raw = game_leaders_lines(game) if leaders else game_primary_lines(game)
 	lines = prepare_lines(lines_raw, max_lines=4, max_chars=15)
 	draw_frame(canvas, lines)
-	canvas = matrix.SwapOnVSync(canvas)
+	swap_canvas(matrix, canvas)
 	time.sleep(hold)
 
 
+# Logo layouts by game state; both run their own scroll timing.
+_LOGO_LAYOUTS = {'pre': _render_pre, 'post': _render_post}
+
+
+def _logos_fit(width: int, height: int) -> bool:
+	"""Whether the panel has room for two corner logos plus the centered text."""
+	return width >= 48 and height >= 24
+
+
+def render_game(matrix, game: NFLGame, leaders: bool = False, hold: float = 2.5, show_logos: bool = True, canvas_size: Tuple[int, int] | None = None):
+	canvas = frame_canvas(matrix)
+	# cycle_games probes the panel once and passes canvas_size; direct callers fall back to the canvas
+	width, height = canvas_size or panel_size(canvas)
+	layout = _LOGO_LAYOUTS.get(game.state or '') if show_logos and _logos_fit(width, height) else None
+	if layout is not None:
+		layout(matrix, canvas, game, width, height)
+	else:
+		_render_simple(matrix, canvas, game, width, height, leaders=leaders, hold=hold)
+
+
 def cycle_games(matrix, games: Iterable[NFLGame], *, show_leaders: bool = False, per_game_seconds: float = 5.0, pre_game_seconds: float = 3.0, show_logos: bool = True):
-	for g in games:
-		is_pre = getattr(g, 'state', '') == 'pre'
-		base_hold = pre_game_seconds if is_pre else per_game_seconds
-		render_game(matrix, g, leaders=False, hold=base_hold, show_logos=show_logos)
-		# Leader screens disabled per request; skipping secondary render.
+	games = list(games)
+	size = panel_size(matrix)  # panel size never changes; probe once per cycle
+	# Fetch logos on one background worker, in display order, so later games download
+	# while earlier ones are on screen (same approach as the MLB screen). Panels too
+	# small for the logo layouts never draw them, so they skip the prefetch.
+	preload = preload_logos if show_logos and _logos_fit(*size) else None
+	with closing(prefetched(games, preload)) as queue:
+		for g in queue:
+			is_pre = getattr(g, 'state', '') == 'pre'
+			base_hold = pre_game_seconds if is_pre else per_game_seconds
+			render_game(matrix, g, leaders=False, hold=base_hold, show_logos=show_logos, canvas_size=size)
+			# Leader screens disabled per request; skipping secondary render.
 
 
-__all__ = ["cycle_games", "render_game"]
+__all__ = ["cycle_games", "render_game", "preload_logos"]
@@ -1,9 +1,9 @@
 """Premier League screen rendering for 64x32 panel."""
 from __future__ import annotations
 import time
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 from ..GameClasses.premGame import PremGame
-from .common import prepare_lines, draw_frame
+from .common import prepare_lines, draw_frame, frame_canvas, swap_canvas
 
 
 def game_primary_lines(game: PremGame) -> List[str]:
@@ -11,24 +11,26 @@ def game_primary_lines(game: PremGame) -> List[str]:
 	return base
 
 
-def game_leaders_lines(game: PremGame) -> List[str]:
+def game_leaders_lines(game: PremGame) -> Tuple[str, ...]:
 	return game.leaders_lines()
 
 
 def render_game(matrix, game: PremGame, leaders: bool = False, hold: float = 2.5):
-	canvas = matrix.CreateFrameCanvas()
+	canvas = frame_canvas(matrix)
 	lines_raw = game_leaders_lines(game) if leaders else game_primary_lines(game)
 	lines = prepare_lines(lines_raw, max_lines=4, max_chars=15)
 	draw_frame(canvas, lines)
-	canvas = matrix.SwapOnVSync(canvas)
+	swap_canvas(matrix, canvas)
 	time.sleep(hold)
 
 
 def cycle_games(matrix, games: Iterable[PremGame], *, show_leaders: bool = True, per_game_seconds: float = 4.0):
+	# Holds are loop-invariant; the leaders screen splits the per-game time in half.
+	score_hold = per_game_seconds / 2 if show_leaders else per_game_seconds
 	for g in games:
-		render_game(matrix, g, leaders=False, hold=per_game_seconds / (2 if show_leaders else 1))
+		render_game(matrix, g, leaders=False, hold=score_hold)
 		if show_leaders:
-			render_game(matrix, g, leaders=True, hold=per_game_seconds / 2)
+			render_game(matrix, g, leaders=True, hold=score_hold)
 
 
 __all__ = ["cycle_games", "render_game"]
@@ -6,7 +6,7 @@ from __future__ import annotations
 import time
 from typing import Iterable, List, Callable
 from ..GameClasses.nflGame import NFLGame
-from .common import prepare_lines, draw_frame
+from .common import prepare_lines, draw_frame, frame_canvas, swap_canvas
 
 
 def _leader_fragment(game: NFLGame, key: str, label: str) -> str:
@@ -33,10 +33,10 @@ def receiving_line(game: NFLGame) -> List[str]:
 
 
 def _render_matrix(matrix, lines_raw: List[str], hold: float):
-	canvas = matrix.CreateFrameCanvas()
+	canvas = frame_canvas(matrix)
 	lines = prepare_lines(lines_raw, max_lines=4, max_chars=15)
 	draw_frame(canvas, lines)
-	canvas = matrix.SwapOnVSync(canvas)
+	swap_canvas(matrix, canvas)
 	time.sleep(hold)
 
 
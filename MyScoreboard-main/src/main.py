@@ -220,12 +220,13 @@ def main():
 
 def _show_placeholder(matrix, *lines: str):
     try:
-        from .Screens.common import draw_frame
+        from .Screens.common import draw_frame, frame_canvas, swap_canvas
     except Exception:
         return
-    canvas = matrix.CreateFrameCanvas()
+    # Redrawn every EMPTY_INTERVAL while a sport has no data; reuse the back buffer.
+    canvas = frame_canvas(matrix)
     draw_frame(canvas, list(lines)[:4])
-    matrix.SwapOnVSync(canvas)
+    swap_canvas(matrix, canvas)
 
 
 def _show_test_pattern(matrix):
@@ -233,7 +234,8 @@ def _show_test_pattern(matrix):
         from rgbmatrix import graphics  # type: ignore
     except Exception:
         pass
-    canvas = matrix.CreateFrameCanvas()
+    from .Screens.common import draw_frame, frame_canvas, swap_canvas
+    canvas = frame_canvas(matrix)
     # Attempt colored gradient if SetPixel exists
     for x in range(64):
         for y in range(32):
@@ -241,9 +243,8 @@ def _show_test_pattern(matrix):
                 canvas.SetPixel(x, y, (x*4)%256, (y*8)%256, ((x+y)*2)%256)  # type: ignore[attr-defined]
             except Exception:
                 break
-    from .Screens.common import draw_frame
     draw_frame(canvas, ["TEST", "PATTERN", "OK"], center=True)
-    matrix.SwapOnVSync(canvas)
+    swap_canvas(matrix, canvas)
     print("[INFO] Test pattern shown.")
 
 if __name__ == "__main__":
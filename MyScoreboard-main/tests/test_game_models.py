@@ -0,0 +1,386 @@
+"""Regression tests for the game model presentation helpers.
+
+Expected values were captured from the pre-optimization models (score/status/
+leaders/detail lines, as_dict, period tables, MLB situation fields and the
+in-progress inning label the MLB screen used to parse inline). The memoized
+and slotted models must keep producing exactly the same output.
+
+Run from the project root: python -m unittest discover -s tests -t .
+"""
+import copy
+import unittest
+
+from src.GameClasses.factory import game_from_event
+from src.mock_data import mock_events
+
+
+# Edge cases beyond mock_data: period table bounds, every leader category,
+# missing status/period, long names and the generic (unknown sport) model.
+EXTRA_EVENTS = [
+	{"id": "nfl_q0", "sport": "nfl", "state": "in", "clock": "15:00", "period": 0,
+	 "home_team": {"abbreviation": "KC", "score": "0"}, "away_team": {"abbreviation": "BUF", "score": "0"}},
+	{"id": "nfl_q4", "sport": "nfl", "state": "in", "clock": "0:42", "period": 4,
+	 "home_team": {"abbreviation": "KC", "score": "21"}, "away_team": {"abbreviation": "BUF", "score": "24"},
+	 "leaders": {"passing": {"athlete": "P.Mahomes", "display": "301Y 3TD"},
+	             "rushing": {"athlete": "J.Cook", "display": "88Y"},
+	             "receiving": {"athlete": "T.Kelce", "display": "9-110Y"}},
+	 "last_play": "Mahomes pass deep right to Kelce for 31 yards, TOUCHDOWN. " * 2},
+	{"id": "nfl_ot", "sport": "nfl", "state": "in", "clock": "8:10", "period": 5,
+	 "home_team": {"abbreviation": "KC", "score": "27"}, "away_team": {"abbreviation": "BUF", "score": "27"},
+	 "leaders": {"rushing": {"athlete": "I.Pacheco"}}},
+	{"id": "nfl_post_nostatus", "sport": "nfl", "state": "post", "status": "", "period": 4,
+	 "home_team": {"abbreviation": "KC", "score": "30"}, "away_team": {"abbreviation": "BUF", "score": "27"}},
+	{"id": "mlb_b9", "sport": "mlb", "state": "in", "period": 9, "display_inning": "B9",
+	 "home_team": {"abbreviation": "NYY", "score": 3}, "away_team": {"abbreviation": "LAD", "score": 5},
+	 "leaders": {"pitching": {"athlete": "Y.Yamamoto", "display": "7.0 IP 1ER 9K"},
+	             "batting": {"athlete": "S.Ohtani", "display": "3-4 2HR"}},
+	 "batter": "Giancarlo Stanton Jr.", "pitcher": "Y.Yamamoto", "outs_text": "2 OUTS", "half": "Bottom",
+	 "on_first": True, "on_second": True, "on_third": 1, "last_play": "Judge walks."},
+	{"id": "mlb_extra", "sport": "mlb", "state": "in", "period": 20, "clock": "",
+	 "home_team": {"abbreviation": "NYY", "score": 7}, "away_team": {"abbreviation": "LAD", "score": 7}},
+	{"id": "mlb_long", "sport": "mlb", "state": "in", "period": 21, "half": "top",
+	 "home_team": {"abbreviation": "NYY", "score": 8}, "away_team": {"abbreviation": "LAD", "score": 7}},
+	{"id": "mlb_no_period", "sport": "mlb", "state": "in",
+	 "home_team": {"abbreviation": "NYY", "score": 0}, "away_team": {"abbreviation": "LAD", "score": 0}},
+	{"id": "prem_2h", "sport": "prem", "state": "in", "clock": "78'", "period": 2,
+	 "home_team": {"abbreviation": "ARS", "score": "2"}, "away_team": {"abbreviation": "CHE", "score": "2"},
+	 "leaders": {"goals": [{"athlete": "Saka", "display": "1 G"}, {"athlete": "Palmer", "display": "2 G"}],
+	             "assists": [{"athlete": "Odegaard", "display": "1 A"}, {"athlete": "Rice", "display": "1 A"}]}},
+	{"id": "prem_et", "sport": "prem", "state": "in", "clock": "105'", "period": 3,
+	 "home_team": {"abbreviation": "ARS", "score": "2"}, "away_team": {"abbreviation": "CHE", "score": "2"}},
+	{"id": "generic", "sport": "nhl", "state": "in", "clock": "12:00", "period": 2,
+	 "home_team": {"abbreviation": "BOS", "score": "1"}, "away_team": {"abbreviation": "TOR", "score": "2"},
+	 "leaders": {"goals": {"athlete": "Pastrnak", "display": "1 G"},
+	             "saves": [{"athlete": "Swayman", "display": "30 SV"}]}},
+	{"id": "mlb_probables", "sport": "mlb", "state": "pre", "status": "Scheduled",
+	 "home_team": {"abbreviation": "NYY", "score": 0,
+	               "probables": [{"athlete": {"displayName": "Gerrit Cole", "shortName": "G. Cole"}}]},
+	 "away_team": {"abbreviation": "LAD", "score": 0, "probable_pitcher": "Tyler Glasnow"}},
+]
+
+SAMPLE_EVENTS = [e for sport in ("nfl", "mlb", "prem") for e in mock_events[sport]] + EXTRA_EVENTS
+
+# id -> (sport, score_line, status_line, leaders_lines, detail_lines, _period_text)
+EXPECTED = {
+	'401697025_final': (
+		'mlb',
+		'WSH 5 - 11 CHC',
+		'Final',
+		('P J.Assad 6.0 IP 2ER 7K', 'B N.Hoerner 2-4 HR 2B 2RBI'),
+		('WSH 5 - 11 CHC', 'Final'),
+		'In 9',
+	),
+	'401697025_in': (
+		'mlb',
+		'WSH 4 - 11 CHC',
+		'T6',
+		('B R.McGuire 2-4 HR RBI R',),
+		('WSH 4 - 11 CHC', 'T6', 'Swanson doubles to deep left, Hoerner scores.'),
+		'T6',
+	),
+	'401697025_pre': (
+		'mlb',
+		'WSH 0 - 0 CHC',
+		'Scheduled',
+		(),
+		('WSH 0 - 0 CHC', 'Scheduled'),
+		'',
+	),
+	'generic': (
+		'generic',
+		'TOR 2 - 1 BOS',
+		'P2 12:00',
+		('GOA Pastrnak 1 G', 'SAV Swayman 30 SV'),
+		('TOR 2 - 1 BOS', 'P2 12:00'),
+		'P2',
+	),
+	'mlb_b9': (
+		'mlb',
+		'LAD 5 - 3 NYY',
+		'B9',
+		('P Y.Yamamoto 7.0 IP 1ER 9K', 'B S.Ohtani 3-4 2HR'),
+		('LAD 5 - 3 NYY', 'B9', 'Judge walks.'),
+		'B9',
+	),
+	'mlb_extra': (
+		'mlb',
+		'LAD 7 - 7 NYY',
+		'In 20',
+		(),
+		('LAD 7 - 7 NYY', 'In 20'),
+		'In 20',
+	),
+	'mlb_long': (
+		'mlb',
+		'LAD 7 - 8 NYY',
+		'In 21',
+		(),
+		('LAD 7 - 8 NYY', 'In 21'),
+		'In 21',
+	),
+	'mlb_no_period': (
+		'mlb',
+		'LAD 0 - 0 NYY',
+		'',
+		(),
+		('LAD 0 - 0 NYY', ''),
+		'',
+	),
+	'mlb_probables': (
+		'mlb',
+		'LAD 0 - 0 NYY',
+		'Scheduled',
+		(),
+		('LAD 0 - 0 NYY', 'Scheduled'),
+		'',
+	),
+	'nfl_in_1': (
+		'nfl',
+		'DAL 13 - 10 PHI',
+		'Q2 05:12',
+		('QB J.Hurts 145Y 1TD',),
+		('DAL 13 - 10 PHI', 'Q2 05:12', 'Hurts pass short left to Brown for 8 yards'),
+		'Q2',
+	),
+	'nfl_ot': (
+		'nfl',
+		'BUF 27 - 27 KC',
+		'Q5 8:10',
+		('RB I.Pacheco ',),
+		('BUF 27 - 27 KC', 'Q5 8:10'),
+		'Q5',
+	),
+	'nfl_post_1': (
+		'nfl',
+		'NE 14 - 17 NYJ',
+		'Final',
+		('QB A.Rodgers 230Y 2TD',),
+		('NE 14 - 17 NYJ', 'Final'),
+		'Q4',
+	),
+	'nfl_post_nostatus': (
+		'nfl',
+		'BUF 27 - 30 KC',
+		'Final',
+		(),
+		('BUF 27 - 30 KC', 'Final'),
+		'Q4',
+	),
+	'nfl_pre_1': (
+		'nfl',
+		'BUF 0 - 0 KC',
+		'Scheduled',
+		(),
+		('BUF 0 - 0 KC', 'Scheduled'),
+		'',
+	),
+	'nfl_q0': (
+		'nfl',
+		'BUF 0 - 0 KC',
+		'15:00',
+		(),
+		('BUF 0 - 0 KC', '15:00'),
+		'',
+	),
+	'nfl_q4': (
+		'nfl',
+		'BUF 24 - 21 KC',
+		'Q4 0:42',
+		('QB P.Mahomes 301Y 3TD', 'RB J.Cook 88Y', 'WR T.Kelce 9-110Y'),
+		('BUF 24 - 21 KC', 'Q4 0:42', 'Mahomes pass deep right to Kelce for 31 yards, T'),
+		'Q4',
+	),
+	'prem_2h': (
+		'prem',
+		'CHE 2 - 2 ARS',
+		"2H 78'",
+		('G Saka 1 G', 'G Palmer 2 G', 'G Odegaard 1 A'),
+		('CHE 2 - 2 ARS', "2H 78'"),
+		'2H',
+	),
+	'prem_et': (
+		'prem',
+		'CHE 2 - 2 ARS',
+		"P3 105'",
+		(),
+		('CHE 2 - 2 ARS', "P3 105'"),
+		'P3',
+	),
+	'prem_in_1': (
+		'prem',
+		'CHE 0 - 1 ARS',
+		'1H 45:00',
+		('G Saka 1 G',),
+		('CHE 0 - 1 ARS', '1H 45:00', 'Saka scores with left footed shot.'),
+		'1H',
+	),
+	'prem_post_1': (
+		'prem',
+		'TOT 2 - 2 MUN',
+		'Final',
+		(),
+		('TOT 2 - 2 MUN', 'Final'),
+		'2H',
+	),
+	'prem_pre_1': (
+		'prem',
+		'LIV 0 - 0 MCI',
+		'Scheduled',
+		(),
+		('LIV 0 - 0 MCI', 'Scheduled'),
+		'',
+	),
+}
+
+# id -> (batter, pitcher, outs_text, half, bases, inning_info(), (away, home) probable_pitcher)
+EXPECTED_MLB = {
+	'401697025_final': (
+		'',
+		'',
+		'',
+		'',
+		(False, False, False),
+		('', '9'),
+		(None, None),
+	),
+	'401697025_in': (
+		'P.Crow-Armstr',
+		'J.Assad',
+		'1 OUT',
+		'top',
+		(True, False, False),
+		('top', 'TOP 6'),
+		(None, None),
+	),
+	'401697025_pre': (
+		'',
+		'',
+		'',
+		'',
+		(False, False, False),
+		('', ''),
+		(None, None),
+	),
+	'mlb_b9': (
+		'Giancarlo Stan',
+		'Y.Yamamoto',
+		'2 OUTS',
+		'bottom',
+		(True, True, True),
+		('bot', 'BOT 9'),
+		(None, None),
+	),
+	'mlb_extra': (
+		'',
+		'',
+		'',
+		'',
+		(False, False, False),
+		('', '20'),
+		(None, None),
+	),
+	'mlb_long': (
+		'',
+		'',
+		'',
+		'top',
+		(False, False, False),
+		('top', 'TOP 21'),
+		(None, None),
+	),
+	'mlb_no_period': (
+		'',
+		'',
+		'',
+		'',
+		(False, False, False),
+		('', ''),
+		(None, None),
+	),
+	'mlb_probables': (
+		'',
+		'',
+		'',
+		'',
+		(False, False, False),
+		('', ''),
+		('Tyler Glasnow', 'Gerrit Cole'),
+	),
+}
+
+
+def _games():
+	# Fresh deep copies: games keep a reference to their raw event
+	return [game_from_event(copy.deepcopy(ev)) for ev in SAMPLE_EVENTS]
+
+
+class GameModelOutputTest(unittest.TestCase):
+	def test_every_sample_has_expected_output(self):
+		self.assertEqual(sorted(g.id for g in _games()), sorted(EXPECTED))
+
+	def test_presentation_lines_match_baseline(self):
+		for g in _games():
+			with self.subTest(game=g.id):
+				sport, score, status, leaders, detail, period = EXPECTED[g.id]
+				self.assertEqual(g.sport, sport)
+				self.assertEqual(g.score_line(), score)
+				self.assertEqual(g.status_line(), status)
+				self.assertEqual(tuple(g.leaders_lines()), leaders)
+				self.assertEqual(tuple(g.detail_lines()), detail)
+				self.assertEqual(g._period_text(), period)
+
+	def test_as_dict_matches_baseline(self):
+		for g in _games():
+			with self.subTest(game=g.id):
+				sport, score, status, leaders, detail, _ = EXPECTED[g.id]
+				d = g.as_dict()
+				self.assertEqual(set(d), {"id", "sport", "score_line", "status_line", "leaders", "detail_lines"})
+				self.assertEqual(d["id"], g.id)
+				self.assertEqual(d["sport"], sport)
+				self.assertEqual(d["score_line"], score)
+				self.assertEqual(d["status_line"], status)
+				self.assertEqual(tuple(d["leaders"]), leaders)
+				self.assertEqual(tuple(d["detail_lines"]), detail)
+
+	def test_repeated_calls_are_stable(self):
+		for g in _games():
+			with self.subTest(game=g.id):
+				first = (g.score_line(), g.status_line(), g.leaders_lines(), g.detail_lines(), g.as_dict())
+				for _ in range(3):
+					again = (g.score_line(), g.status_line(), g.leaders_lines(), g.detail_lines(), g.as_dict())
+					self.assertEqual(again, first)
+				# Memoized results are handed back as-is, not rebuilt
+				self.assertIs(g.score_line(), first[0])
+				self.assertIs(g.status_line(), first[1])
+				self.assertIs(g.leaders_lines(), first[2])
+				self.assertIs(g.as_dict(), first[4])
+
+	def test_games_are_slotted(self):
+		for g in _games():
+			with self.subTest(game=g.id):
+				self.assertFalse(hasattr(g, "__dict__"))
+				self.assertFalse(hasattr(g.home, "__dict__"))
+
+
+class MLBGameFieldsTest(unittest.TestCase):
+	def test_situation_fields_and_inning_match_baseline(self):
+		for g in _games():
+			if g.sport != "mlb":
+				continue
+			with self.subTest(game=g.id):
+				batter, pitcher, outs, half, bases, inning, probables = EXPECTED_MLB[g.id]
+				self.assertEqual(g.batter, batter)
+				self.assertEqual(g.pitcher, pitcher)
+				self.assertEqual(g.outs_text, outs)
+				self.assertEqual(g.half, half)
+				self.assertEqual(g.bases, bases)
+				self.assertEqual(g.inning_info(), inning)
+				self.assertIs(g.inning_info(), g.inning_info())
+				self.assertEqual((g.away.probable_pitcher, g.home.probable_pitcher), probables)
+
+	def test_every_mlb_sample_has_expected_fields(self):
+		self.assertEqual(sorted(g.id for g in _games() if g.sport == "mlb"), sorted(EXPECTED_MLB))
+
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,209 @@
+"""Tests for the shared screen helpers in src/Screens/common.py.
+
+Drawing goes through a fake canvas that records DrawText/SetImage/Clear calls
+and a fake matrix that records SwapOnVSync and hands back its other buffer the
+way rgbmatrix does, so no LED hardware (or Pillow) is needed.
+
+Run from the project root: python -m unittest discover -s tests -t .
+"""
+import unittest
+from unittest import mock
+
+from src.Screens import common
+
+
+class FakeCanvas:
+	width = 64
+	height = 32
+
+	def __init__(self):
+		self.calls = []
+
+	def Clear(self):
+		self.calls.append(('Clear',))
+
+	def SetImage(self, image, x, y):
+		self.calls.append(('SetImage', image, x, y))
+
+
+class FakeMatrix:
+	"""Double-buffered like RGBMatrix: SwapOnVSync shows a canvas and returns the previous one."""
+
+	width = 64
+	height = 32
+
+	def __init__(self):
+		self.created = []
+		self.swaps = []
+		self._front = FakeCanvas()
+
+	def CreateFrameCanvas(self):
+		canvas = FakeCanvas()
+		self.created.append(canvas)
+		return canvas
+
+	def SwapOnVSync(self, canvas):
+		self.swaps.append(canvas)
+		back, self._front = self._front, canvas
+		return back
+
+
+def _record_draw_text(canvas, font, x, y, color, text):
+	canvas.calls.append(('DrawText', x, y, text))
+	return x + len(text) * 4
+
+
+class FakeClock:
+	"""Stands in for the time module: sleep() advances monotonic() instead of blocking."""
+
+	def __init__(self, now):
+		self.now = now
+		self.slept = []
+
+	def monotonic(self):
+		return self.now
+
+	def sleep(self, seconds):
+		self.slept.append(seconds)
+		self.now += seconds
+
+
+class DrawScrollTextTest(unittest.TestCase):
+	def setUp(self):
+		patcher = mock.patch.object(common.graphics, 'DrawText', _record_draw_text)
+		patcher.start()
+		self.addCleanup(patcher.stop)
+
+	@staticmethod
+	def _old_loop(canvas, font, x, y, color, text, char_w, width):
+		# The per-character loop draw_scroll_text replaced in the MLB/NFL scrollers
+		for idx, ch in enumerate(text):
+			cx = x + idx * char_w
+			if -char_w <= cx < width:
+				common.graphics.DrawText(canvas, font, cx, y, color, ch)
+
+	def test_matches_old_visible_range_loop(self):
+		texts = ('', 'A', 'BOS 3 NYY 2', 'FENWAY PARK - BOSTON, MA * FIRST PITCH 7:10 PM * ' * 3)
+		for text in texts:
+			for char_w in (4, 6):
+				for width in (32, 64, 128):
+					for x in range(-len(text) * char_w - 10, width + 10):
+						expected, actual = FakeCanvas(), FakeCanvas()
+						self._old_loop(expected, None, x, 31, common.WHITE, text, char_w, width)
+						common.draw_scroll_text(actual, None, x, 31, common.WHITE, text, char_w, width)
+						self.assertEqual(actual.calls, expected.calls, (text, char_w, width, x))
+
+	def test_only_visible_glyphs_are_drawn(self):
+		canvas = FakeCanvas()
+		common.draw_scroll_text(canvas, None, -400, 31, common.WHITE, 'X' * 200, 4, 64)
+		self.assertEqual([c[1] for c in canvas.calls], list(range(-4, 64, 4)))
+
+
+class PaceFrameTest(unittest.TestCase):
+	def _pace(self, clock, deadline, step):
+		with mock.patch.object(common, 'time', clock):
+			return common.pace_frame(deadline, step)
+
+	def test_sleeps_the_rest_of_the_step(self):
+		clock = FakeClock(10.25)
+		self.assertEqual(self._pace(clock, 10.0, 1.0), 11.0)
+		self.assertEqual(clock.slept, [0.75])
+
+	def test_short_overrun_keeps_the_schedule(self):
+		clock = FakeClock(11.5)
+		self.assertEqual(self._pace(clock, 10.0, 1.0), 11.0)
+		self.assertEqual(clock.slept, [])
+
+	def test_resyncs_after_overrun_of_more_than_a_step(self):
+		clock = FakeClock(13.0)
+		deadline = self._pace(clock, 10.0, 1.0)
+		self.assertEqual(deadline, 13.0)
+		self.assertEqual(clock.slept, [])
+		# The next frame is paced from now instead of bursting to catch up
+		clock.now = 13.25
+		self.assertEqual(self._pace(clock, deadline, 1.0), 14.0)
+		self.assertEqual(clock.slept, [0.75])
+
+
+class FrameCanvasTest(unittest.TestCase):
+	def _matrix(self):
+		matrix = FakeMatrix()
+		self.addCleanup(common._BACK_BUFFER.pop, id(matrix), None)
+		return matrix
+
+	def test_first_frame_creates_a_canvas(self):
+		matrix = self._matrix()
+		canvas = common.frame_canvas(matrix)
+		self.assertEqual(matrix.created, [canvas])
+
+	def test_reuses_the_buffer_swap_hands_back(self):
+		matrix = self._matrix()
+		canvas = common.frame_canvas(matrix)
+		back = common.swap_canvas(matrix, canvas)
+		self.assertEqual(matrix.swaps, [canvas])
+		for _ in range(3):
+			nxt = common.frame_canvas(matrix)
+			self.assertIs(nxt, back)
+			self.assertEqual(nxt.calls[-1], ('Clear',))
+			back = common.swap_canvas(matrix, nxt)
+		self.assertEqual(len(matrix.created), 1)
+
+	def test_failed_render_keeps_the_cached_buffer(self):
+		matrix = self._matrix()
+		back = common.swap_canvas(matrix, common.frame_canvas(matrix))
+		self.assertIs(common.frame_canvas(matrix), back)  # render raised before swapping
+		self.assertIs(common.frame_canvas(matrix), back)
+		self.assertEqual(len(matrix.created), 1)
+
+	def test_set_image_lands_on_the_reused_canvas(self):
+		matrix = self._matrix()
+		common.swap_canvas(matrix, common.frame_canvas(matrix))
+		canvas = common.frame_canvas(matrix)
+		common.blit_logo(canvas, mock.Mock(size=(16, 16)), 0, 0, 64, 32)
+		self.assertEqual([c[0] for c in canvas.calls], ['Clear', 'SetImage'])
+		common.swap_canvas(matrix, canvas)
+		self.assertIs(matrix.swaps[-1], canvas)
+
+
+class PrepareLinesTest(unittest.TestCase):
+	@staticmethod
+	def _old_prepare_lines(raw_lines, max_lines=5, max_chars=15):
+		# prepare_lines before the fit-already fast path: wrap and truncate every line
+		out = []
+		for line in raw_lines:
+			if not line:
+				continue
+			for wrapped in common.wrap_text(line, max_chars):
+				if len(out) >= max_lines:
+					return out
+				out.append(common.truncate(wrapped, max_chars))
+		return out
+
+	def test_lines_that_fit_are_unchanged(self):
+		cases = (
+			['BOS 3 NYY 2', 'TOP 7TH', '1 OUT'],
+			['NE 21 BUF 17', 'FINAL'],
+			['', 'EXACTLY FIFTEEN', ''],
+			['A  B', ' LEAD', 'TRAIL ', '   ', 'TAB\tSEP'],
+			['ONE', 'TWO', 'THREE', 'FOUR', 'FIVE', 'SIX'],
+		)
+		for lines in cases:
+			for max_lines, max_chars in ((5, 15), (3, 15), (5, 16), (2, 12)):
+				self.assertEqual(
+					common.prepare_lines(lines, max_lines, max_chars),
+					self._old_prepare_lines(lines, max_lines, max_chars),
+					(lines, max_lines, max_chars),
+				)
+
+	def test_long_lines_still_wrap(self):
+		lines = ['GILLETTE STADIUM FOXBOROUGH', 'Q4 02:11']
+		self.assertEqual(common.prepare_lines(lines), self._old_prepare_lines(lines))
+
+	def test_returns_a_fresh_list(self):
+		first = common.prepare_lines(['FINAL'])
+		first.append('X')
+		self.assertEqual(common.prepare_lines(['FINAL']), ['FINAL'])
+
+
+if __name__ == "__main__":
+	unittest.main()